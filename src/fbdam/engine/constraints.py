@@ -75,11 +75,10 @@ def _get_model_params(m: pyo.ConcreteModel) -> Dict[str, Any]:
 
 
 def _get_lambda_value(model_params: Mapping[str, Any]) -> float | None:
-    for key in ("lambda", "lambda_", "lam"):
-        if key in model_params:
-            value = model_params[key]
-            return float(value)
-    return None
+    value = model_params.get("lambda")
+    if value is None:
+        value = model_params.get("lambda_", model_params.get("lam"))
+    return None if value is None else float(value)
 
 # ═══════════════════════════════════════════════════════════════════
 # Dial resolution — Simplified and explicit
@@ -381,7 +380,7 @@ def add_deviation_item_cap(m: pyo.ConcreteModel, params: dict) -> None:
 
     def rule(model, i):
         alpha = _get_dial_value(model, params, "alpha_i", i)
-        return sum(model.dpos[i, h] + model.dneg[i, h] for h in model.H) <= alpha * model.Avail[i]
+        return pyo.quicksum(model.dpos[i, h] + model.dneg[i, h] for h in model.H) <= alpha * model.Avail[i]
 
     m.DeviationItemCap = pyo.Constraint(m.I, rule=rule)
 
@@ -408,7 +407,7 @@ def add_deviation_household_cap(m: pyo.ConcreteModel, params: dict) -> None:
     def rule(model, h):
         beta = _get_dial_value(model, params, "beta_h", h)
         fair_target = model.fairshare_weight[h] * model.TotSupply
-        return sum(model.dpos[i, h] + model.dneg[i, h] for i in model.I) <= beta * fair_target
+        return pyo.quicksum(model.dpos[i, h] + model.dneg[i, h] for i in model.I) <= beta * fair_target
 
     m.DeviationHouseholdCap = pyo.Constraint(m.H, rule=rule)
 
@@ -479,7 +478,7 @@ def add_fairshare_cap_house(m: pyo.ConcreteModel, params: dict) -> None:
         beta = _get_dial_value(m, params, "beta", default=0.7)
 
     def rule(model, h):
-        return sum(model.dpos[i, h] + model.dneg[i, h] for i in model.I) <= beta * model.fairshare_weight[h] * model.TotSupply
+        return pyo.quicksum(model.dpos[i, h] + model.dneg[i, h] for i in model.I) <= beta * model.fairshare_weight[h] * model.TotSupply
 
     m.FairCapHouse = pyo.Constraint(m.H, rule=rule)
 
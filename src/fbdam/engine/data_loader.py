@@ -7,17 +7,30 @@ Responsibility:
 - Return a DataBundle ready for model building.
 
 Design notes:
-- Uses stdlib csv module (no pandas dependency for data loading).
+- Uses stdlib csv module (no pandas dependency for data loading); pyarrow's
+  CSV reader is used instead when it is installed. With ``FBDAM_CSV_CACHE=1``
+  the parsed tables are also cached next to each CSV as Feather files.
 - Streaming API for memory efficiency.
+- Independent CSVs are read concurrently on a small thread pool.
 - Strong validation at load time.
 """
 
 from __future__ import annotations
 
+import copy
 import csv
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Tuple
+from sys import intern
+from types import MappingProxyType
+from typing import AbstractSet, Any, Dict, List, Mapping, Tuple
+
+import yaml
 
 from fbdam.engine.domain import (
     DomainIndex,
@@ -32,6 +45,24 @@ from fbdam.engine.domain import (
     AllocationBounds,
 )
 
+try:  # LibYAML C parser when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader
+
+try:  # Optional bulk CSV ingestion (pip install fbdam[fast_csv])
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as pa_feather
+except ImportError:  # pragma: no cover - stdlib csv fallback
+    pa = None
+    pa_csv = None
+    pa_feather = None
+
+if pa_csv is not None:
+    _LARGE_READ_OPTIONS = pa_csv.ReadOptions(use_threads=True, block_size=16 << 20)
+    _SMALL_READ_OPTIONS = pa_csv.ReadOptions(use_threads=False)
+
 
 # ----------------------------- Exceptions ------------------------------------
 
@@ -40,6 +71,40 @@ class DataLoaderError(RuntimeError):
     """Raised when CSV loading or validation fails."""
 
 
+# ----------------------------- Column specs ----------------------------------
+
+_ITEMS_REQUIRED = frozenset(("item_id", "name", "stock"))
+_ITEMS_NUMERIC = frozenset(("stock", "cost"))
+_NUTRIENTS_REQUIRED = frozenset(("nutrient_id", "name"))
+_NUTRIENTS_NUMERIC: frozenset[str] = frozenset()
+_HOUSEHOLDS_REQUIRED = frozenset(("household_id", "name"))
+_HOUSEHOLDS_NUMERIC = frozenset(("members", "fairshare_weight", "size"))
+_ITEM_NUTRIENTS_REQUIRED = frozenset(("item_id", "nutrient_id", "qty_per_unit"))
+_ITEM_NUTRIENTS_NUMERIC = frozenset(("qty_per_unit",))
+_REQUIREMENTS_REQUIRED = frozenset(("household_id", "nutrient_id", "requirement"))
+_REQUIREMENTS_NUMERIC = frozenset(("requirement",))
+_BOUNDS_REQUIRED = frozenset(("item_id", "household_id"))
+_BOUNDS_NUMERIC = frozenset(("lower", "upper"))
+
+# Key/required column getters (one C-level call returns every column list);
+# both CSV backends yield these columns as ``str`` already
+_ITEMS_COLUMNS = itemgetter("item_id", "name", "stock")
+_NUTRIENTS_COLUMNS = itemgetter("nutrient_id", "name")
+_HOUSEHOLDS_COLUMNS = itemgetter("household_id", "name")
+_ITEM_NUTRIENTS_COLUMNS = itemgetter("item_id", "nutrient_id", "qty_per_unit")
+_REQUIREMENTS_COLUMNS = itemgetter("household_id", "nutrient_id", "requirement")
+_BOUNDS_COLUMNS = itemgetter("item_id", "household_id")
+
+# Entity id columns, interned on read (see _intern_ids)
+_ID_COLUMNS = frozenset({"item_id", "nutrient_id", "household_id"})
+
+# Read buffer for the stdlib CSV path (fewer read syscalls on large relations)
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Opt-in side-car Feather cache for the pyarrow path (see _read_arrow)
+_CSV_CACHE_ENV = "FBDAM_CSV_CACHE"
+
+
 # ----------------------------- Data structures -------------------------------
 
 
@@ -94,42 +159,52 @@ def load_domain_and_params(
         DataLoaderError: If CSVs are malformed or missing required columns
     """
     
-    # 1. Load domain entities from CSVs
-    items = _load_items(_resolve_data_path(data_paths, "items", "items_csv"))
-    nutrients = _load_nutrients(_resolve_data_path(data_paths, "nutrients", "nutrients_csv"))
-    households = _load_households(_resolve_data_path(data_paths, "households", "households_csv"))
-    item_nutrients = _load_item_nutrients(
-        _resolve_data_path(data_paths, "item_nutrients", "item_nutrients_csv")
-    )
-    requirements = _load_requirements(
-        _resolve_data_path(data_paths, "requirements", "requirements_csv")
+    # 1. Load domain entities from CSVs (independent reads, overlapped on a pool;
+    #    results are collected in declaration order so the first failing
+    #    loader is the one reported, exactly as with serial loading).
+    #    The params YAML is read on the same pool; its result is only
+    #    collected after validation, preserving the serial error order.
+    loaders = (
+        (_load_items, ("items", "items_csv")),
+        (_load_nutrients, ("nutrients", "nutrients_csv")),
+        (_load_households, ("households", "households_csv")),
+        (_load_item_nutrients, ("item_nutrients", "item_nutrients_csv")),
+        (_load_requirements, ("requirements", "requirements_csv")),
+        (_load_bounds, ("bounds", "household_item_bounds", "household_item_bounds_csv")),
     )
-    bounds = _load_bounds(
-        _resolve_data_path(
-            data_paths,
-            "bounds",
-            "household_item_bounds",
-            "household_item_bounds_csv",
+    with ThreadPoolExecutor(max_workers=len(loaders) + 1) as pool:
+        params_future = pool.submit(
+            _load_model_params,
+            _resolve_data_path(data_paths, "params", "params_yaml"),
+            model_section,
         )
-    )
-    
-    # 2. Validate referential integrity
-    _validate_references(items, nutrients, households, item_nutrients, requirements, bounds)
-    
-    domain = DomainIndex(
-        items=items,
-        nutrients=nutrients,
-        households=households,
-        item_nutrients=item_nutrients,
-        requirements=requirements,
-        bounds=bounds,
-    )
-    
-    # 3. Load model parameters (dials, budget, etc.)
-    model_params = _load_model_params(
-        _resolve_data_path(data_paths, "params", "params_yaml"),
-        model_section,
-    )
+        futures = [
+            pool.submit(loader, _resolve_data_path(data_paths, *aliases))
+            for loader, aliases in loaders
+        ]
+        items, nutrients, households, item_nutrients, requirements, (bounds, default_bounds) = (
+            future.result() for future in futures
+        )
+        
+        # 2. Validate referential integrity (default bounds rows are not
+        #    stored but their ids must still reference known entities)
+        _validate_references(
+            items, nutrients, households, item_nutrients, requirements, bounds,
+            default_bounds=default_bounds,
+        )
+        
+        # Read-only views: consumers can share the mappings without defensive copies
+        domain = DomainIndex(
+            items=MappingProxyType(items),
+            nutrients=MappingProxyType(nutrients),
+            households=MappingProxyType(households),
+            item_nutrients=MappingProxyType(item_nutrients),
+            requirements=MappingProxyType(requirements),
+            bounds=MappingProxyType(bounds),
+        )
+        
+        # 3. Model parameters (dials, budget, etc.)
+        model_params = params_future.result()
     
     return DataBundle(domain=domain, model_params=model_params)
 
@@ -137,22 +212,227 @@ def load_domain_and_params(
 # ----------------------------- CSV reading utilities -------------------------
 
 
+def _read_columns(
+    path: Path,
+    *,
+    required_columns: AbstractSet[str],
+    numeric_columns: AbstractSet[str] = frozenset(),
+    large: bool = False,
+) -> Dict[str, List[Any]]:
+    """
+    Read a whole CSV file into column lists keyed by header name.
+
+    Uses ``pyarrow.csv`` (C++ tokenizer, typed conversion) when installed and
+    falls back to the stdlib reader in :func:`_read_csv` otherwise. Both paths
+    return the same shape: non-numeric columns as ``str`` and numeric columns
+    as ``float`` (or ``""`` for empty cells).
+
+    ``large`` marks the O(I·N)/O(H·N) relations: pyarrow then tokenizes
+    16 MiB blocks on its thread pool. Small entity files are parsed on the
+    calling thread, where pool start-up would dominate.
+
+    Raises:
+        DataLoaderError: If file not found, columns missing or a numeric cell
+                         cannot be parsed
+    """
+    if pa_csv is None:
+        columns = _read_csv(
+            path,
+            required_columns=required_columns,
+            numeric_columns=numeric_columns,
+        )
+    else:
+        columns = _read_arrow(
+            path,
+            required_columns=required_columns,
+            numeric_columns=numeric_columns,
+            large=large,
+        )
+    return _intern_ids(columns)
+
+
+def _intern_ids(columns: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    """
+    Intern the id columns in place.
+
+    Every CSV row yields a fresh ``str`` per id; interning collapses repeats
+    (an item id appears once per nutrient and per household) into one shared
+    object, so relation keys take less memory and dict probes between them
+    hit the identity fast path before comparing characters.
+    """
+    for col in _ID_COLUMNS.intersection(columns):
+        columns[col] = list(map(intern, columns[col]))
+    return columns
+
+
+def _read_arrow(
+    path: Path,
+    *,
+    required_columns: AbstractSet[str],
+    numeric_columns: AbstractSet[str],
+    large: bool,
+) -> Dict[str, List[Any]]:
+    """pyarrow backend of :func:`_read_columns`."""
+    if not path.is_file():
+        raise DataLoaderError(f"Dataset not found: {path}")
+
+    # Peek at the header so every non-numeric column is read as text (ids such
+    # as "001" must not be inferred as integers).
+    with path.open("r", encoding="utf-8", newline="") as fh:
+        header = next(csv.reader(fh), None)
+    if not header:
+        raise DataLoaderError(f"{path.name}: Empty or malformed CSV (no header)")
+
+    found_cols = set(header)
+    missing = required_columns - found_cols
+    if missing:
+        raise DataLoaderError(
+            f"{path.name}: Missing required columns: {sorted(missing)}. "
+            f"Found: {sorted(found_cols)}"
+        )
+
+    column_types = {
+        col: pa.float64() if col in numeric_columns else pa.string() for col in header
+    }
+    cache_path = _feather_cache_path(path) if _csv_cache_enabled() else None
+    if cache_path is not None:
+        cached = _read_feather_cache(cache_path)
+        if cached is not None:
+            return _arrow_columns(cached, numeric_columns)
+
+    try:
+        table = pa_csv.read_csv(
+            path,
+            read_options=_LARGE_READ_OPTIONS if large else _SMALL_READ_OPTIONS,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                null_values=[""],
+                strings_can_be_null=False,
+            ),
+        )
+    except pa.ArrowInvalid:
+        # Ragged rows or unparsable numeric cells: the stdlib reader accepts
+        # the former (padding/truncating like DictReader) and reports the
+        # latter as file:line, so both backends agree on what is valid.
+        return _read_csv(
+            path,
+            required_columns=required_columns,
+            numeric_columns=numeric_columns,
+        )
+
+    if cache_path is not None:
+        _write_feather_cache(table, path, cache_path)
+
+    return _arrow_columns(table, numeric_columns)
+
+
+def _arrow_columns(table: Any, numeric_columns: AbstractSet[str]) -> Dict[str, List[Any]]:
+    """Column lists of ``table``, with empty numeric cells as ``""`` like :func:`_read_csv`."""
+    columns = table.to_pydict()
+    for col in numeric_columns.intersection(columns):
+        if table.column(col).null_count:
+            columns[col] = ["" if value is None else value for value in columns[col]]
+    return columns
+
+
+def _csv_cache_enabled() -> bool:
+    """Side-car Feather caching is opt-in via ``FBDAM_CSV_CACHE=1``."""
+    return os.environ.get(_CSV_CACHE_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _feather_cache_path(path: Path) -> Path:
+    """Side-car cache file fingerprinted by the CSV's (mtime_ns, size)."""
+    stat = path.stat()
+    return path.with_name(f"{path.name}.{stat.st_mtime_ns}_{stat.st_size}.feather")
+
+
+def _read_feather_cache(cache_path: Path) -> Any | None:
+    """
+    Return the cached table, or None when there is no usable cache.
+
+    A truncated or otherwise unreadable file is deleted so the caller
+    re-parses the CSV and rewrites it.
+    """
+    try:
+        return pa_feather.read_table(cache_path)
+    except FileNotFoundError:
+        return None
+    except (OSError, pa.ArrowInvalid):
+        try:
+            cache_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None
+
+
+def _write_feather_cache(table: Any, path: Path, cache_path: Path) -> None:
+    """
+    Persist ``table`` next to ``path`` and drop stale fingerprints (best effort).
+
+    The file is written under a temporary name and moved into place with
+    ``os.replace``, so concurrent readers (e.g. parallel sweep processes)
+    never see a partially written cache.
+    """
+    tmp_name = None
+    try:
+        for stale in path.parent.glob(f"{path.name}.*.feather"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{cache_path.name}.", suffix=".tmp")
+        os.close(fd)
+        pa_feather.write_feather(table, tmp_name, compression="uncompressed")
+        os.replace(tmp_name, cache_path)
+        tmp_name = None
+    except OSError:  # read-only dataset directories simply skip caching
+        pass
+    finally:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def _all_non_negative(values: List[Any]) -> bool:
+    """
+    True when every value is a float >= 0, checked with one C-level min().
+
+    Blank cells (``""``/``None``) make ``min`` raise TypeError; callers then
+    take the checked constructor path, which reports the offending row.
+    """
+    try:
+        return not values or min(values) >= 0
+    except TypeError:
+        return False
+
+
+def _optional_column(columns: Mapping[str, List[Any]], name: str, size: int) -> List[Any]:
+    """Return column ``name`` or a list of ``None`` when the CSV omits it."""
+    values = columns.get(name)
+    return values if values is not None else [None] * size
+
+
 def _read_csv(
     path: Path,
     *,
-    required_columns: Iterable[str],
-    numeric_columns: Iterable[str] | None = None,
-) -> Iterable[Dict[str, Any]]:
+    required_columns: AbstractSet[str],
+    numeric_columns: AbstractSet[str] = frozenset(),
+) -> Dict[str, List[Any]]:
     """
-    Read CSV file and yield rows as dicts with basic validation and type coercion.
+    Read CSV file into column lists keyed by header name, with basic
+    validation and type coercion.
+
+    Rows come from ``csv.reader`` (plain lists, no per-row dict) over a large
+    read buffer; column positions are resolved once from the header.
     
     Args:
         path: Path to CSV file
         required_columns: Columns that must exist (raises if missing)
         numeric_columns: Columns to coerce to float (optional)
     
-    Yields:
-        Dict[str, Any]: Row with string keys and coerced values
+    Returns:
+        Dict[str, List[Any]]: One list per column, aligned by row (short rows
+        are padded with empty strings)
         
     Raises:
         DataLoaderError: If file not found or columns missing
@@ -160,36 +440,85 @@ def _read_csv(
     if not path.is_file():
         raise DataLoaderError(f"Dataset not found: {path}")
     
-    numeric_cols = set(numeric_columns or [])
-    required_cols = set(required_columns)
-    
-    with path.open("r", encoding="utf-8", newline="") as fh:
-        reader = csv.DictReader(fh)
+    with path.open("r", encoding="utf-8", newline="", buffering=_CSV_BUFFER_SIZE) as fh:
+        reader = csv.reader(fh)
         
         # Validate header
-        if reader.fieldnames is None:
+        header = next(reader, None)
+        if not header:
             raise DataLoaderError(f"{path.name}: Empty or malformed CSV (no header)")
         
-        found_cols = set(reader.fieldnames)
-        missing = required_cols - found_cols
+        found_cols = set(header)
+        missing = required_columns - found_cols
         if missing:
             raise DataLoaderError(
-                f"{path.name}: Missing required columns: {missing}. "
-                f"Found: {found_cols}"
+                f"{path.name}: Missing required columns: {sorted(missing)}. "
+                f"Found: {sorted(found_cols)}"
             )
+
+        width = len(header)
         
-        # Yield rows with type coercion
-        for row_num, row in enumerate(reader, start=2):  # start=2 (header is row 1)
-            # Coerce numeric columns
-            for col in numeric_cols:
-                if col in row and row[col]:
-                    try:
-                        row[col] = float(row[col])
-                    except ValueError as e:
-                        raise DataLoaderError(
-                            f"{path.name}:{row_num}: Cannot convert '{col}'='{row[col]}' to float"
-                        ) from e
-            yield row
+        # Append each cell straight into its column (no intermediate row
+        # list to transpose afterwards)
+        values: List[List[Any]] = [[] for _ in header]
+        appenders = [column.append for column in values]
+        for row in reader:
+            if not row:  # blank line
+                continue
+            if len(row) != width:
+                row = (row + [""] * width)[:width]
+            for append, cell in zip(appenders, row):
+                append(cell)
+
+    # Coerce numeric columns in bulk, outside the row loop
+    for pos, col in enumerate(header):
+        if col in numeric_columns:
+            values[pos] = _float_column(values[pos], path, col)
+
+    return dict(zip(header, values))
+
+
+def _float_column(cells: List[str], path: Path, col: str) -> List[Any]:
+    """
+    Convert a text column to floats, leaving empty cells untouched.
+
+    Dense columns (the common case) are streamed through ``map(float, ...)``;
+    a single ``try`` guards the whole column, so clean data pays no per-cell
+    exception setup and the offending cell is only located on failure.
+    """
+    try:
+        if "" not in cells:
+            return list(map(float, cells))
+        return [float(cell) if cell else cell for cell in cells]
+    except ValueError:
+        pass
+
+    # Slow path: locate the offending cell for a precise error message.
+    for row_idx, cell in enumerate(cells):
+        if not cell:
+            continue
+        try:
+            float(cell)
+        except ValueError as e:
+            raise DataLoaderError(
+                f"{path.name}:{_csv_line_number(path, row_idx)}: "
+                f"Cannot convert '{col}'='{cell}' to float"
+            ) from e
+    raise DataLoaderError(f"{path.name}: Cannot convert '{col}' to float")  # pragma: no cover
+
+
+def _csv_line_number(path: Path, row_idx: int) -> int:
+    """Return the physical line of data row ``row_idx`` (blank lines skipped)."""
+    with path.open("r", encoding="utf-8", newline="") as fh:
+        reader = csv.reader(fh)
+        next(reader, None)
+        seen = -1
+        for row in reader:
+            if row:
+                seen += 1
+                if seen == row_idx:
+                    break
+        return reader.line_num
 
 
 # ----------------------------- Loaders per entity ----------------------------
@@ -200,19 +529,29 @@ def _load_items(path: Path | None) -> Dict[ItemId, Item]:
     if not path:
         raise DataLoaderError("Missing 'items' path in data_paths")
     
-    items = {}
-    for row in _read_csv(
+    cols = _read_columns(
         path,
-        required_columns=["item_id", "name", "stock"],
-        numeric_columns=["stock", "cost"],
+        required_columns=_ITEMS_REQUIRED,
+        numeric_columns=_ITEMS_NUMERIC,
+    )
+    item_ids, names, stocks = _ITEMS_COLUMNS(cols)
+    size = len(item_ids)
+
+    make_item = Item
+    items = {}
+    for item_id, name, stock, cost, unit in zip(
+        item_ids,
+        names,
+        stocks,
+        _optional_column(cols, "cost", size),
+        _optional_column(cols, "unit", size),
     ):
-        item_id = str(row["item_id"])
-        items[item_id] = Item(
+        items[item_id] = make_item(
             item_id=item_id,
-            name=str(row["name"]),
-            stock=float(row["stock"]),
-            cost=float(row.get("cost") or 0.0),
-            unit=str(row.get("unit") or "") or None,
+            name=name,
+            stock=float(stock),
+            cost=float(cost or 0.0),
+            unit=str(unit or "") or None,
         )
     
     return items
@@ -223,17 +562,25 @@ def _load_nutrients(path: Path | None) -> Dict[NutrientId, Nutrient]:
     if not path:
         raise DataLoaderError("Missing 'nutrients' path in data_paths")
     
-    nutrients = {}
-    for row in _read_csv(
+    cols = _read_columns(
         path,
-        required_columns=["nutrient_id", "name"],
-        numeric_columns=[],
+        required_columns=_NUTRIENTS_REQUIRED,
+        numeric_columns=_NUTRIENTS_NUMERIC,
+    )
+    nutrient_ids, names = _NUTRIENTS_COLUMNS(cols)
+    size = len(nutrient_ids)
+
+    make_nutrient = Nutrient
+    nutrients = {}
+    for nutrient_id, name, unit in zip(
+        nutrient_ids,
+        names,
+        _optional_column(cols, "unit", size),
     ):
-        nutrient_id = str(row["nutrient_id"])
-        nutrients[nutrient_id] = Nutrient(
+        nutrients[nutrient_id] = make_nutrient(
             nutrient_id=nutrient_id,
-            name=str(row["name"]),
-            unit=str(row.get("unit") or "") or None,
+            name=name,
+            unit=str(unit or "") or None,
         )
     
     return nutrients
@@ -244,26 +591,29 @@ def _load_households(path: Path | None) -> Dict[HouseholdId, Household]:
     if not path:
         raise DataLoaderError("Missing 'households' path in data_paths")
     
-    households = {}
-    rows = list(
-        _read_csv(
-            path,
-            required_columns=["household_id", "name"],
-            numeric_columns=["members", "fairshare_weight", "size"],
-        )
+    cols = _read_columns(
+        path,
+        required_columns=_HOUSEHOLDS_REQUIRED,
+        numeric_columns=_HOUSEHOLDS_NUMERIC,
     )
+    household_ids, names = _HOUSEHOLDS_COLUMNS(cols)
+    size = len(household_ids)
 
-    if not rows:
+    if not size:
         return {}
 
     members_map: Dict[str, float] = {}
-    for row in rows:
-        household_id = str(row["household_id"])
-        raw_members = row.get("members")
+    for household_id, members, hh_size, weight in zip(
+        household_ids,
+        _optional_column(cols, "members", size),
+        _optional_column(cols, "size", size),
+        _optional_column(cols, "fairshare_weight", size),
+    ):
+        raw_members = members
         if raw_members in (None, ""):
-            raw_members = row.get("size")
+            raw_members = hh_size
         if raw_members in (None, ""):
-            raw_members = row.get("fairshare_weight")
+            raw_members = weight
         members_value = float(raw_members or 1.0)
         if members_value < 0:
             raise DataLoaderError(
@@ -277,13 +627,14 @@ def _load_households(path: Path | None) -> Dict[HouseholdId, Household]:
             f"{path.name}: total household members must be > 0 (got {total_members})"
         )
 
-    for row in rows:
-        household_id = str(row["household_id"])
+    make_household = Household
+    households = {}
+    for household_id, name in zip(household_ids, names):
         members_value = members_map[household_id]
         fair_share = members_value / total_members
-        households[household_id] = Household(
+        households[household_id] = make_household(
             household_id=household_id,
-            name=str(row["name"]),
+            name=name,
             members=members_value,
             fairshare_weight=fair_share,
         )
@@ -296,20 +647,31 @@ def _load_item_nutrients(path: Path | None) -> Dict[Tuple[ItemId, NutrientId], I
     if not path:
         raise DataLoaderError("Missing 'item_nutrients' path in data_paths")
     
-    item_nutrients = {}
-    for row in _read_csv(
+    cols = _read_columns(
         path,
-        required_columns=["item_id", "nutrient_id", "qty_per_unit"],
-        numeric_columns=["qty_per_unit"],
-    ):
-        key = (str(row["item_id"]), str(row["nutrient_id"]))
-        item_nutrients[key] = ItemNutrient(
-            item_id=str(row["item_id"]),
-            nutrient_id=str(row["nutrient_id"]),
-            qty_per_unit=float(row["qty_per_unit"]),
+        required_columns=_ITEM_NUTRIENTS_REQUIRED,
+        numeric_columns=_ITEM_NUTRIENTS_NUMERIC,
+        large=True,
+    )
+
+    item_ids, nutrient_ids, qtys = _ITEM_NUTRIENTS_COLUMNS(cols)
+    if _all_non_negative(qtys):
+        # Column validated in bulk: skip the per-row __post_init__ checks
+        make_trusted = ItemNutrient._unchecked
+        return {
+            (item_id, nutrient_id): make_trusted(item_id, nutrient_id, qty)
+            for item_id, nutrient_id, qty in zip(item_ids, nutrient_ids, qtys)
+        }
+
+    make_entry = ItemNutrient
+    return {
+        (item_id, nutrient_id): make_entry(
+            item_id=item_id,
+            nutrient_id=nutrient_id,
+            qty_per_unit=float(qty),
         )
-    
-    return item_nutrients
+        for item_id, nutrient_id, qty in zip(item_ids, nutrient_ids, qtys)
+    }
 
 
 def _load_requirements(path: Path | None) -> Dict[Tuple[HouseholdId, NutrientId], Requirement]:
@@ -317,48 +679,88 @@ def _load_requirements(path: Path | None) -> Dict[Tuple[HouseholdId, NutrientId]
     if not path:
         raise DataLoaderError("Missing 'requirements' path in data_paths")
     
-    requirements = {}
-    for row in _read_csv(
+    cols = _read_columns(
         path,
-        required_columns=["household_id", "nutrient_id", "requirement"],
-        numeric_columns=["requirement"],
-    ):
-        key = (str(row["household_id"]), str(row["nutrient_id"]))
-        amount_val = row.get("requirement")
-        requirements[key] = Requirement(
-            household_id=str(row["household_id"]),
-            nutrient_id=str(row["nutrient_id"]),
+        required_columns=_REQUIREMENTS_REQUIRED,
+        numeric_columns=_REQUIREMENTS_NUMERIC,
+        large=True,
+    )
+
+    household_ids, nutrient_ids, amounts = _REQUIREMENTS_COLUMNS(cols)
+    if _all_non_negative(amounts):
+        # Column validated in bulk: skip the per-row __post_init__ checks
+        make_trusted = Requirement._unchecked
+        return {
+            (household_id, nutrient_id): make_trusted(household_id, nutrient_id, amount)
+            for household_id, nutrient_id, amount in zip(household_ids, nutrient_ids, amounts)
+        }
+
+    make_entry = Requirement
+    return {
+        (household_id, nutrient_id): make_entry(
+            household_id=household_id,
+            nutrient_id=nutrient_id,
             amount=float(amount_val),
         )
-    
-    return requirements
+        for household_id, nutrient_id, amount_val in zip(household_ids, nutrient_ids, amounts)
+    }
 
 
-def _load_bounds(path: Path | None) -> Dict[Tuple[ItemId, HouseholdId], AllocationBounds]:
-    """Load allocation bounds from CSV (optional)."""
+def _load_bounds(
+    path: Path | None,
+) -> Tuple[Dict[Tuple[ItemId, HouseholdId], AllocationBounds], AbstractSet[Tuple[ItemId, HouseholdId]]]:
+    """
+    Load allocation bounds from CSV (optional).
+
+    Rows with the default bounds (0, None) are not stored, since
+    :meth:`DomainIndex.get_bounds` implies them for missing keys; their keys
+    are returned separately so reference validation still covers them.
+    """
     if not path or not path.exists():
-        return {}
+        return {}, frozenset()
     
-    bounds = {}
-    for row in _read_csv(
+    cols = _read_columns(
         path,
-        required_columns=["item_id", "household_id"],
-        numeric_columns=["lower", "upper"],
+        required_columns=_BOUNDS_REQUIRED,
+        numeric_columns=_BOUNDS_NUMERIC,
+    )
+    item_ids, household_ids = _BOUNDS_COLUMNS(cols)
+    size = len(item_ids)
+
+    make_checked = AllocationBounds
+    make_trusted = AllocationBounds._unchecked
+    bounds = {}
+    default_keys = set()
+    for item_id, household_id, lower, upper_val in zip(
+        item_ids,
+        household_ids,
+        _optional_column(cols, "lower", size),
+        _optional_column(cols, "upper", size),
     ):
-        key = (str(row["item_id"]), str(row["household_id"]))
-        
         # Handle optional upper bound
-        upper_val = row.get("upper")
         upper = float(upper_val) if upper_val not in (None, "", "None") else None
+        lower = float(lower or 0.0)
         
-        bounds[key] = AllocationBounds(
-            item_id=str(row["item_id"]),
-            household_id=str(row["household_id"]),
-            lower=float(row.get("lower") or 0.0),
-            upper=upper,
-        )
+        # Default bounds (0, None) are implied for missing keys; keep sparse.
+        # A later default row still overrides an earlier explicit one.
+        if lower == 0.0 and upper is None:
+            bounds.pop((item_id, household_id), None)
+            default_keys.add((item_id, household_id))
+            continue
+        
+        # Valid rows skip __post_init__; invalid ones go through the checked
+        # constructor, which raises the descriptive error
+        if lower >= 0.0 and (upper is None or upper >= lower):
+            bounds[(item_id, household_id)] = make_trusted(item_id, household_id, lower, upper)
+        else:
+            bounds[(item_id, household_id)] = make_checked(
+                item_id=item_id,
+                household_id=household_id,
+                lower=lower,
+                upper=upper,
+            )
     
-    return bounds
+    return bounds, default_keys
 
 
 # ----------------------------- Model parameters ------------------------------
@@ -376,38 +778,38 @@ def _load_model_params(params_path: Path | None, model_section: Mapping[str, Any
     Returns:
         Dict with consolidated parameters (budget, lambda, dials, ...)
     """
-    import yaml
-    
     params: Dict[str, Any] = {}
     file_params: Dict[str, Any] = {}
 
-    # Load from params.yaml if exists
-    if params_path and params_path.exists():
-        with open(params_path, "r", encoding="utf-8") as f:
-            loaded = yaml.safe_load(f) or {}
+    # Load from params.yaml if exists (one stat() serves both the existence
+    # check and the cache key)
+    fingerprint = _file_fingerprint(params_path) if params_path else None
+    if fingerprint is not None:
+        loaded = _read_params_yaml(str(params_path), *fingerprint)
         if not isinstance(loaded, dict):
             raise DataLoaderError("params.yaml must be a mapping of keys → values")
-        file_params = loaded
+        file_params = copy.deepcopy(loaded)
         params.update(file_params)
 
-    # Merge scenario-level dials (model.dials)
+    # Merge scenario-level dials (model.dials); YAML yields plain dicts, so
+    # the cheap exact-type check is enough for the file side
     merged_dials: Dict[str, Any] = {}
     dials_from_file = file_params.get("dials")
-    if isinstance(dials_from_file, Mapping):
+    if type(dials_from_file) is dict:
         merged_dials.update(dials_from_file)
-    dials_from_scenario = model_section.get("dials", {})
-    if isinstance(dials_from_scenario, Mapping):
+    dials_from_scenario = model_section.get("dials")
+    if dials_from_scenario and isinstance(dials_from_scenario, Mapping):
         merged_dials.update(dials_from_scenario)
     params["dials"] = merged_dials
 
     # Budget and lambda priorities: scenario overrides file, defaults to None
     if "budget" in model_section:
-        params["budget"] = model_section.get("budget")
+        params["budget"] = model_section["budget"]
     else:
         params.setdefault("budget", None)
 
     if "lambda" in model_section:
-        params["lambda"] = model_section.get("lambda")
+        params["lambda"] = model_section["lambda"]
     else:
         params.setdefault("lambda", params.get("lambda_penalty"))
 
@@ -416,13 +818,35 @@ def _load_model_params(params_path: Path | None, model_section: Mapping[str, Any
         params["lambda_penalty"] = params["lambda"]
 
     # Surface any nested "params" dict in model_section for convenience
-    params_block = model_section.get("params", {})
-    if isinstance(params_block, Mapping):
+    params_block = model_section.get("params")
+    if params_block and isinstance(params_block, Mapping):
         params.update(params_block)
 
     return params
 
 
+def _file_fingerprint(path: Path) -> Tuple[int, int] | None:
+    """Return the file's (mtime_ns, size), or None when it does not exist."""
+    try:
+        stat = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=32)
+def _read_params_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse params.yaml with the LibYAML C loader when available.
+
+    Cached per (path, mtime_ns, size) so repeated scenario loads over the
+    same dataset parse it once (the size catches rewrites within one tick of
+    a coarse filesystem clock); callers must copy the result before mutating
+    it.
+    """
+    return yaml.load(Path(path).read_bytes(), Loader=_YamlLoader) or {}
+
+
 # ----------------------------- Validation ------------------------------------
 
 
@@ -433,40 +857,45 @@ def _validate_references(
     item_nutrients: Dict[Tuple[ItemId, NutrientId], ItemNutrient],
     requirements: Dict[Tuple[HouseholdId, NutrientId], Requirement],
     bounds: Dict[Tuple[ItemId, HouseholdId], AllocationBounds],
+    *,
+    default_bounds: AbstractSet[Tuple[ItemId, HouseholdId]] = frozenset(),
 ) -> None:
     """
     Validate referential integrity across loaded entities.
+
+    ``default_bounds`` holds the keys of bounds rows that were not stored
+    (see :func:`_load_bounds`); they are checked like the stored ones.
     """
-    
-    # Check item_nutrients
-    for (item_id, nutrient_id), _ in item_nutrients.items():
-        if item_id not in items:
-            raise DataLoaderError(
-                f"item_nutrients references unknown item_id='{item_id}'"
-            )
-        if nutrient_id not in nutrients:
-            raise DataLoaderError(
-                f"item_nutrients references unknown nutrient_id='{nutrient_id}'"
-            )
-    
-    # Check requirements
-    for (household_id, nutrient_id), _ in requirements.items():
-        if household_id not in households:
-            raise DataLoaderError(
-                f"requirements references unknown household_id='{household_id}'"
-            )
-        if nutrient_id not in nutrients:
-            raise DataLoaderError(
-                f"requirements references unknown nutrient_id='{nutrient_id}'"
-            )
-    
-    # Check bounds
-    for (item_id, household_id), _ in bounds.items():
-        if item_id not in items:
-            raise DataLoaderError(
-                f"bounds references unknown item_id='{item_id}'"
-            )
-        if household_id not in households:
-            raise DataLoaderError(
-                f"bounds references unknown household_id='{household_id}'"
-            )
\ No newline at end of file
+
+    # Snapshot the id sets once so every check below probes the same
+    # pre-hashed structure.
+    items_keys = frozenset(items)
+    nutrients_keys = frozenset(nutrients)
+    households_keys = frozenset(households)
+
+    # Check each relation column against the known ids with one C-level set
+    # difference per column instead of a Python-level probe per row.
+    bound_keys = bounds.keys() | default_bounds if default_bounds else bounds
+    for relation, keys, columns in (
+        ("item_nutrients", item_nutrients, (("item_id", items_keys), ("nutrient_id", nutrients_keys))),
+        ("requirements", requirements, (("household_id", households_keys), ("nutrient_id", nutrients_keys))),
+        ("bounds", bound_keys, (("item_id", items_keys), ("household_id", households_keys))),
+    ):
+        if not keys:
+            continue
+        key_columns = tuple(zip(*keys))
+        for (column, known), values in zip(columns, key_columns):
+            unknown = set(values).difference(known)
+            if unknown:
+                _raise_unknown_references(relation, column, unknown)
+
+
+def _raise_unknown_references(relation: str, column: str, unknown: AbstractSet[str]) -> None:
+    """Raise a DataLoaderError listing (up to ten) unknown ids of ``column``."""
+    if len(unknown) == 1:
+        (only,) = unknown
+        raise DataLoaderError(f"{relation} references unknown {column}='{only}'")
+    shown = sorted(unknown)[:10]
+    raise DataLoaderError(
+        f"{relation} references {len(unknown)} unknown {column} values: {shown}"
+    )
@@ -7,14 +7,20 @@ consumed by the model builder after the I/O layer prepares data.
 
 Design goals:
 - Immutability with @dataclass(frozen=True) → safer and easier to reason about
+- Value objects use slots=True (no per-instance __dict__)
 - Minimal validation to catch common data issues early
 - No imports from pandas/pyomo; keep concerns separated
+- Relations also expose Structure-of-Arrays (NumPy) views for vectorised consumers
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Mapping, Optional
+from dataclasses import dataclass, fields
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
+
+import numpy as np
 
 # ---------------------------
 # Common type aliases (IDs)
@@ -28,7 +34,7 @@ HouseholdId = str
 # Value objects (core domain)
 # ---------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Item:
     """
     A product that can be allocated (e.g., rice, beans).
@@ -54,7 +60,7 @@ class Item:
             raise ValueError("Item.name cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Nutrient:
     """
     A nutrient tracked by the model (e.g., Protein, Iron).
@@ -72,7 +78,7 @@ class Nutrient:
             raise ValueError("Nutrient.name cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Household:
     """
     A demand recipient (e.g., a family, household, or beneficiary unit).
@@ -104,7 +110,7 @@ class Household:
             )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Requirement:
     """
     Requirement R for a given (household, nutrient).
@@ -121,9 +127,18 @@ class Requirement:
                 f"({self.household_id}, {self.nutrient_id})"
             )
 
+    @classmethod
+    def _unchecked(cls, household_id: HouseholdId, nutrient_id: NutrientId, amount: float) -> Requirement:
+        """Trusted constructor skipping __post_init__; caller validated in bulk."""
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "household_id", household_id)
+        object.__setattr__(obj, "nutrient_id", nutrient_id)
+        object.__setattr__(obj, "amount", amount)
+        return obj
 
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ItemNutrient:
     """
     Nutrient content of an item.
@@ -141,8 +156,17 @@ class ItemNutrient:
                 f"({self.item_id}, {self.nutrient_id})"
             )
 
+    @classmethod
+    def _unchecked(cls, item_id: ItemId, nutrient_id: NutrientId, qty_per_unit: float) -> ItemNutrient:
+        """Trusted constructor skipping __post_init__; caller validated in bulk."""
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "item_id", item_id)
+        object.__setattr__(obj, "nutrient_id", nutrient_id)
+        object.__setattr__(obj, "qty_per_unit", qty_per_unit)
+        return obj
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AllocationBounds:
     """
     Per-(item, household) bounds applied to decision variable x[item, household].
@@ -170,10 +194,71 @@ class AllocationBounds:
                 f"for ({self.item_id}, {self.household_id})"
             )
 
+    @classmethod
+    def _unchecked(
+        cls, item_id: ItemId, household_id: HouseholdId, lower: float, upper: Optional[float]
+    ) -> AllocationBounds:
+        """Trusted constructor skipping __post_init__; caller validated the row."""
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "item_id", item_id)
+        object.__setattr__(obj, "household_id", household_id)
+        object.__setattr__(obj, "lower", lower)
+        object.__setattr__(obj, "upper", upper)
+        return obj
+
 # ---------------------------
 # Aggregated, read-only views
 # ---------------------------
 
+@dataclass(frozen=True, slots=True)
+class RelationArrays:
+    """
+    Structure-of-Arrays view over a keyed relation (e.g. item_nutrients).
+
+    - rows: int32 positions of the first key component in its entity mapping
+    - cols: int32 positions of the second key component in its entity mapping
+    - values: float64 payload aligned with rows/cols; shape (n,) or (n, k)
+
+    Positions follow the iteration order of DomainIndex.items/nutrients/households.
+    Arrays are read-only.
+    """
+    rows: np.ndarray
+    cols: np.ndarray
+    values: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.rows.shape[0])
+
+
+def _relation_arrays(
+    relation: Mapping[tuple[str, str], Any],
+    row_positions: Mapping[str, int],
+    col_positions: Mapping[str, int],
+    value_of: Callable[[Any], Any],
+    width: int = 1,
+) -> RelationArrays:
+    size = len(relation)
+    rows = np.fromiter((row_positions[r] for r, _ in relation), dtype=np.int32, count=size)
+    cols = np.fromiter((col_positions[c] for _, c in relation), dtype=np.int32, count=size)
+    values = np.array([value_of(entry) for entry in relation.values()], dtype=np.float64)
+    values = values.reshape(size) if width == 1 else values.reshape(size, width)
+    for arr in (rows, cols, values):
+        arr.setflags(write=False)
+    return RelationArrays(rows=rows, cols=cols, values=values)
+
+
+def _dense(arrays: RelationArrays, shape: tuple[int, int], fill: float, column: int | None = None) -> np.ndarray:
+    values = arrays.values if column is None else arrays.values[:, column]
+    out = np.full(shape, fill, dtype=np.float64)
+    out[arrays.rows, arrays.cols] = values
+    out.setflags(write=False)
+    return out
+
+
+def _positions(ids: tuple[str, ...]) -> Dict[str, int]:
+    return {key: pos for pos, key in enumerate(ids)}
+
+
 @dataclass(frozen=True)
 class DomainIndex:
     """
@@ -186,6 +271,8 @@ class DomainIndex:
 
     Notes:
       - All mappings should be total over their keys (no missing references)
+      - ``bounds`` is sparse: pairs with default bounds (lower=0, no upper)
+        may be absent; use ``get_bounds`` to read them with the default filled in
       - Keep this object small and predictable (no behavior beyond getters)
     """
     items: Mapping[ItemId, Item]
@@ -213,7 +300,115 @@ class DomainIndex:
         return self.requirements[(household_id, nutrient_id)]
 
     def get_bounds(self, item_id: ItemId, household_id: HouseholdId) -> AllocationBounds:
-        return self.bounds[(item_id, household_id)]
+        bounds = self.bounds.get((item_id, household_id))
+        if bounds is None:
+            return AllocationBounds(item_id=item_id, household_id=household_id)
+        return bounds
+
+    def __reduce__(self):
+        # MappingProxyType views (as handed out by the loader) cannot be pickled
+        # or deep-copied: ship their dicts and re-wrap them on rebuild. Cached
+        # views are not carried over; they are rebuilt lazily.
+        state = tuple(
+            (dict(value), True) if isinstance(value, MappingProxyType) else (value, False)
+            for value in (getattr(self, f.name) for f in fields(self))
+        )
+        return (_rebuild_domain_index, state)
+
+    # Integer positions (built lazily, cached on first access). Each entity id
+    # maps to its position in iteration order; the *_ids tuples are the
+    # reverse tables, so positions[ids[k]] == k.
+
+    @cached_property
+    def item_ids(self) -> tuple[ItemId, ...]:
+        return tuple(self.items)
+
+    @cached_property
+    def nutrient_ids(self) -> tuple[NutrientId, ...]:
+        return tuple(self.nutrients)
+
+    @cached_property
+    def household_ids(self) -> tuple[HouseholdId, ...]:
+        return tuple(self.households)
+
+    @cached_property
+    def item_positions(self) -> Mapping[ItemId, int]:
+        return _positions(self.item_ids)
+
+    @cached_property
+    def nutrient_positions(self) -> Mapping[NutrientId, int]:
+        return _positions(self.nutrient_ids)
+
+    @cached_property
+    def household_positions(self) -> Mapping[HouseholdId, int]:
+        return _positions(self.household_ids)
+
+    # Structure-of-Arrays views (built lazily, cached on first access)
+
+    @cached_property
+    def item_nutrient_arrays(self) -> RelationArrays:
+        """(item, nutrient) positions with qty_per_unit values."""
+        return _relation_arrays(
+            self.item_nutrients,
+            self.item_positions,
+            self.nutrient_positions,
+            lambda entry: entry.qty_per_unit,
+        )
+
+    @cached_property
+    def requirement_arrays(self) -> RelationArrays:
+        """(household, nutrient) positions with requirement amounts."""
+        return _relation_arrays(
+            self.requirements,
+            self.household_positions,
+            self.nutrient_positions,
+            lambda entry: entry.amount,
+        )
+
+    @cached_property
+    def bounds_arrays(self) -> RelationArrays:
+        """(item, household) positions with [lower, upper] columns (upper=inf if uncapped)."""
+        return _relation_arrays(
+            self.bounds,
+            self.item_positions,
+            self.household_positions,
+            lambda entry: (entry.lower, np.inf if entry.upper is None else entry.upper),
+            width=2,
+        )
+
+    # Dense (rows x cols) matrices, scattered from the arrays above; missing
+    # pairs take the relation's default value
+
+    @cached_property
+    def item_nutrient_matrix(self) -> np.ndarray:
+        """qty_per_unit as an (items x nutrients) matrix (0 where absent)."""
+        shape = (len(self.item_ids), len(self.nutrient_ids))
+        return _dense(self.item_nutrient_arrays, shape, 0.0)
+
+    @cached_property
+    def requirement_matrix(self) -> np.ndarray:
+        """Requirement amounts as a (households x nutrients) matrix (0 where absent)."""
+        shape = (len(self.household_ids), len(self.nutrient_ids))
+        return _dense(self.requirement_arrays, shape, 0.0)
+
+    @cached_property
+    def bounds_lower(self) -> np.ndarray:
+        """Lower bounds as an (items x households) matrix (0 where absent)."""
+        shape = (len(self.item_ids), len(self.household_ids))
+        return _dense(self.bounds_arrays, shape, 0.0, column=0)
+
+    @cached_property
+    def bounds_upper(self) -> np.ndarray:
+        """Upper bounds as an (items x households) matrix (inf where uncapped)."""
+        shape = (len(self.item_ids), len(self.household_ids))
+        return _dense(self.bounds_arrays, shape, np.inf, column=1)
+
+
+def _rebuild_domain_index(*state: tuple[Mapping[Any, Any], bool]) -> DomainIndex:
+    """Unpickling hook for DomainIndex (see ``DomainIndex.__reduce__``)."""
+    return DomainIndex(
+        *(MappingProxyType(value) if read_only else value for value, read_only in state)
+    )
 
 
 # ---------------------------
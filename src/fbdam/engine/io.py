@@ -18,7 +18,10 @@ Design notes:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import copy
+import os
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
@@ -28,6 +31,11 @@ import yaml
 from fbdam.engine.data_loader import DataLoaderError, load_domain_and_params
 from fbdam.engine.domain import DomainIndex
 
+try:  # LibYAML C parser when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader
+
 
 # ----------------------------- Exceptions ------------------------------------
 
@@ -39,14 +47,14 @@ class IOConfigError(RuntimeError):
 # ----------------------------- Data shapes -----------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaterializedConstraint:
     """A fully specified constraint block ready for the model builder."""
     id: str                # catalog id / registry key
     params: Dict[str, Any] # concrete parameters (after overrides applied)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaterializedObjective:
     """A fully specified objective block ready for the model builder."""
     id: str                 # catalog id for traceability
@@ -55,14 +63,14 @@ class MaterializedObjective:
     params: Dict[str, Any]  # concrete parameters (after overrides applied)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SolverConfig:
     """Normalized solver configuration."""
     name: str                        # "appsi_highs" | "highs" | ...
     options: Dict[str, Union[str, int, float, bool]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScenarioConfig:
     """
     Builder-ready scenario configuration.
@@ -118,9 +126,13 @@ def load_scenario(scenario_path: Path) -> ScenarioConfig:
         context=f"{config_path.name}::model",
     )
 
-    # Load catalogs packaged with the library
-    constraints_catalog = _load_packaged_yaml("fbdam.config", "catalogs/constraints_v1.1.yaml")
-    objectives_catalog = _load_packaged_yaml("fbdam.config", "catalogs/objectives_v1.0.yaml")
+    # Load catalogs packaged with the library (parsed and indexed once per process)
+    constraints_catalog = _load_catalog_index(
+        "fbdam.config", "catalogs/constraints_v1.1.yaml", root_key="constraints"
+    )
+    objectives_catalog = _load_catalog_index(
+        "fbdam.config", "catalogs/objectives_v1.0.yaml", root_key="objectives"
+    )
 
     # Materialize constraints/objectives
     mat_constraints = _materialize_constraints(
@@ -164,8 +176,8 @@ def load_scenario(scenario_path: Path) -> ScenarioConfig:
         "config": {"id": config_id, "path": str(config_path)},
         "data": {k: str(v) for k, v in data_paths.items()},
         "model": {
-            "constraints": [c.__dict__ for c in mat_constraints],
-            "objectives": [o.__dict__ for o in mat_objectives],
+            "constraints": [asdict(c) for c in mat_constraints],
+            "objectives": [asdict(o) for o in mat_objectives],
         },
         "solver": {"name": solver_cfg.name, "options": solver_cfg.options},
         "model_params": bundle.model_params,
@@ -191,11 +203,37 @@ def load_scenario(scenario_path: Path) -> ScenarioConfig:
 
 def _read_yaml_file(path: Path) -> Dict[str, Any]:
     """Read a YAML file from the filesystem and return a dict (empty dict if file is empty)."""
-    with Path(path).open("rb") as fh:
-        data = yaml.safe_load(fh) or {}
+    path = Path(path)
+    stat = path.stat()
+    data = _parse_yaml_file(str(path), stat.st_mtime_ns, stat.st_size)
     if not isinstance(data, dict):
         raise IOConfigError(f"YAML at {path} must be a mapping at the top-level.")
-    return data
+    # Callers merge into the result; never hand out the cached object
+    return copy.deepcopy(data)
+
+
+@lru_cache(maxsize=64)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, cached per (path, mtime_ns, size).
+
+    Sweeps load many scenarios pointing at the same config; an unchanged file
+    is parsed once. The size guards against rewrites within one tick of a
+    coarse filesystem clock. The cached object is shared and must not be
+    mutated.
+    """
+    return yaml.load(Path(path).read_bytes(), Loader=_YamlLoader) or {}
+
+
+@lru_cache(maxsize=16)
+def _load_catalog_index(package: str, relative: str, root_key: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse and index a packaged catalog once per process.
+
+    The result is shared across ``load_scenario`` calls and must be treated
+    as read-only; materialization copies whatever it hands out.
+    """
+    return _index_catalog(_load_packaged_yaml(package, relative), root_key=root_key, id_key="id")
 
 
 def _load_packaged_yaml(package: str, relative: str) -> Dict[str, Any]:
@@ -214,8 +252,7 @@ def _load_packaged_yaml(package: str, relative: str) -> Dict[str, Any]:
     if not res.is_file():
         raise IOConfigError(f"Packaged YAML not found: {package}:{relative}")
 
-    with res.open("rb") as fh:
-        data = yaml.safe_load(fh) or {}
+    data = yaml.load(res.read_bytes(), Loader=_YamlLoader) or {}
     if not isinstance(data, dict):
         raise IOConfigError(f"Packaged YAML {package}:{relative} must be a mapping.")
     return data
@@ -226,15 +263,15 @@ def _load_packaged_yaml(package: str, relative: str) -> Dict[str, Any]:
 
 def _materialize_constraints(
     entries: List[Dict[str, Any]],
-    catalog: Dict[str, Any],
+    catalog_items: Mapping[str, Dict[str, Any]],
     context: str,
 ) -> List[MaterializedConstraint]:
     """
-    Expand scenario constraint entries against the catalog:
+    Expand scenario constraint entries against the indexed catalog:
     - Each entry may reference a catalog item via `ref`.
     - Optional `override` dict merges into the referenced params.
     """
-    catalog_items = _index_catalog(catalog, root_key="constraints", id_key="id")
+    get_catalog_item = catalog_items.get
     materialized: List[MaterializedConstraint] = []
 
     for i, entry in enumerate(entries):
@@ -244,16 +281,18 @@ def _materialize_constraints(
         if not ref:
             raise IOConfigError(f"{context}[{i}]: missing 'ref' field for constraint.")
 
-        cat = catalog_items.get(ref)
+        cat = get_catalog_item(ref)
         if not cat:
             raise IOConfigError(f"{context}[{i}]: unknown constraint ref '{ref}'.")
 
-        base_params = _require_mapping(cat, "params", default={}, context=f"{context}[{i}::{ref}]")
-        override = entry.get("override", {}) or {}
+        entry_context = f"{context}[{i}::{ref}]"
+        base_params = _require_mapping(cat, "params", default={}, context=entry_context)
+        override = entry.get("override") or {}
         if not isinstance(override, dict):
-            raise IOConfigError(f"{context}[{i}::{ref}]: 'override' must be a mapping if provided.")
+            raise IOConfigError(f"{entry_context}: 'override' must be a mapping if provided.")
 
-        merged = _deep_merge(base_params, override)
+        # Copy so callers never share nested values with the cached catalog
+        merged = copy.deepcopy(_deep_merge(base_params, override))
         materialized.append(MaterializedConstraint(id=ref, params=merged))
 
     return materialized
@@ -261,15 +300,15 @@ def _materialize_constraints(
 
 def _materialize_objectives(
     entries: List[Dict[str, Any]],
-    catalog: Dict[str, Any],
+    catalog_items: Mapping[str, Dict[str, Any]],
     context: str,
 ) -> List[MaterializedObjective]:
     """
-    Expand scenario objective entries against the catalog:
+    Expand scenario objective entries against the indexed catalog:
     - Each entry may reference a catalog item via `ref`.
     - Optional `override` dict merges into the referenced params.
     """
-    catalog_items = _index_catalog(catalog, root_key="objectives", id_key="id")
+    get_catalog_item = catalog_items.get
     materialized: List[MaterializedObjective] = []
 
     for i, entry in enumerate(entries):
@@ -279,18 +318,20 @@ def _materialize_objectives(
         if not ref:
             raise IOConfigError(f"{context}[{i}]: missing 'ref' field for objective.")
 
-        cat = catalog_items.get(ref)
+        cat = get_catalog_item(ref)
         if not cat:
             raise IOConfigError(f"{context}[{i}]: unknown objective ref '{ref}'.")
 
-        name = _require_str(cat, "name", context=f"{context}[{i}::{ref}]")
-        sense = _require_str(cat, "sense", context=f"{context}[{i}::{ref}]")
-        base_params = _require_mapping(cat, "params", default={}, context=f"{context}[{i}::{ref}]")
-        override = entry.get("override", {}) or {}
+        entry_context = f"{context}[{i}::{ref}]"
+        name = _require_str(cat, "name", context=entry_context)
+        sense = _require_str(cat, "sense", context=entry_context)
+        base_params = _require_mapping(cat, "params", default={}, context=entry_context)
+        override = entry.get("override") or {}
         if not isinstance(override, dict):
-            raise IOConfigError(f"{context}[{i}::{ref}]: 'override' must be a mapping if provided.")
+            raise IOConfigError(f"{entry_context}: 'override' must be a mapping if provided.")
 
-        merged = _deep_merge(base_params, override)
+        # Copy so callers never share nested values with the cached catalog
+        merged = copy.deepcopy(_deep_merge(base_params, override))
         materialized.append(MaterializedObjective(id=ref, name=name, sense=sense, params=merged))
 
     return materialized
@@ -379,30 +420,35 @@ def _compose_model_section(
     return _deep_merge(base, override)
 
 
-def _resolve_dataset_paths(dataset_root: Path, dataset_id: str) -> Dict[str, Path]:
-    required_specs = [
-        ("items.csv", True, ("items", "items_csv")),
-        ("nutrients.csv", True, ("nutrients", "nutrients_csv")),
-        ("households.csv", True, ("households", "households_csv")),
-        ("requirements.csv", True, ("requirements", "requirements_csv")),
-        ("item_nutrients.csv", True, ("item_nutrients", "item_nutrients_csv")),
-    ]
-    optional_specs = [
-        ("household_item_bounds.csv", False, ("bounds", "household_item_bounds", "household_item_bounds_csv")),
-        ("params.yaml", False, ("params", "params_yaml")),
-    ]
+# Expected dataset files: (filename, required, data_paths aliases)
+_DATASET_FILES: Tuple[Tuple[str, bool, Tuple[str, ...]], ...] = (
+    ("items.csv", True, ("items", "items_csv")),
+    ("nutrients.csv", True, ("nutrients", "nutrients_csv")),
+    ("households.csv", True, ("households", "households_csv")),
+    ("requirements.csv", True, ("requirements", "requirements_csv")),
+    ("item_nutrients.csv", True, ("item_nutrients", "item_nutrients_csv")),
+    ("household_item_bounds.csv", False, ("bounds", "household_item_bounds", "household_item_bounds_csv")),
+    ("params.yaml", False, ("params", "params_yaml")),
+)
+
 
+def _resolve_dataset_paths(dataset_root: Path, dataset_id: str) -> Dict[str, Path]:
     resolved: Dict[str, Path] = {}
-    dataset_root = dataset_root.resolve()
+    # Plain-string path handling; a Path is built only for files that exist
+    root = os.path.realpath(dataset_root)
+
+    # One directory listing instead of a stat() per expected file
+    with os.scandir(root) as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
 
-    for filename, required, aliases in required_specs + optional_specs:
-        path = (dataset_root / filename).resolve()
-        if path.is_file():
+    for filename, required, aliases in _DATASET_FILES:
+        if filename in present:
+            path = Path(os.path.join(root, filename))
             for alias in aliases:
                 resolved[alias] = path
         elif required:
             raise IOConfigError(
-                f"dataset '{dataset_id}' is missing required file '{filename}' at {path.parent}"
+                f"dataset '{dataset_id}' is missing required file '{filename}' at {root}"
             )
 
     return resolved
@@ -452,17 +498,25 @@ def _normalize_solver(
     return SolverConfig(name=name, options=options)
 
 
+_OPTION_SCALAR_TYPES = (str, int, float, bool)
+_OPTION_EXACT_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def _assert_option_types(options: Dict[str, Any], context: str) -> None:
     """Check that options contain only simple JSON-serializable scalars."""
-    allowed = (str, int, float, bool)
     for k, v in options.items():
-        if not isinstance(v, allowed) and v is not None:
-            raise IOConfigError(f"{context}.options['{k}'] must be a simple scalar (str/int/float/bool).")
+        # Exact-type set probe first; isinstance only for scalar subclasses
+        if type(v) in _OPTION_EXACT_TYPES or isinstance(v, _OPTION_SCALAR_TYPES):
+            continue
+        raise IOConfigError(f"{context}.options['{k}'] must be a simple scalar (str/int/float/bool).")
 
 
 # ------------------------------- Utilities ------------------------------------
 
 
+_MISSING = object()  # sentinel: distinguishes an absent key from an explicit None
+
+
 def _require_str(node: Dict[str, Any], key: str, context: str) -> str:
     val = node.get(key)
     if not isinstance(val, str) or not val:
@@ -471,9 +525,9 @@ def _require_str(node: Dict[str, Any], key: str, context: str) -> str:
 
 
 def _require_mapping(node: Dict[str, Any], key: str, default: Optional[Dict[str, Any]], context: str) -> Dict[str, Any]:
-    if key not in node:
+    val = node.get(key, _MISSING)
+    if val is _MISSING:
         return default or {}
-    val = node.get(key)
     if not isinstance(val, dict):
         raise IOConfigError(f"{context}: '{key}' must be a mapping.")
     return val
@@ -483,11 +537,26 @@ def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any
     """
     Deep-merge two dicts (override wins). Lists are replaced (not merged).
     This is predictable and adequate for parameter overriding patterns.
+
+    An empty override returns ``base`` itself (no copy); the result may share
+    nested values with either input, so callers must not mutate it in place.
     """
+    if not override:
+        return base
+    if not base:
+        return dict(override)
     out: Dict[str, Any] = dict(base)
-    for k, v in override.items():
-        if k in out and isinstance(out[k], dict) and isinstance(v, dict):
-            out[k] = _deep_merge(out[k], v)
-        else:
-            out[k] = v
+    # Walk nested levels with an explicit stack (no recursion depth limit)
+    stack = [(out, override)]
+    while stack:
+        target, layer = stack.pop()
+        for k, v in layer.items():
+            current = target.get(k)
+            if isinstance(current, dict) and isinstance(v, dict):
+                if v:
+                    current = dict(current)
+                    stack.append((current, v))
+                target[k] = current
+            else:
+                target[k] = v
     return out
@@ -1,12 +1,23 @@
 # src/fbdam/engine/io_utils.py
 from __future__ import annotations
 from pathlib import Path
-from datetime import datetime
+import time
 from pyomo.opt import ProblemFormat
+from pyomo.repn.util import FileDeterminism
+
+class _SlugTable(dict):
+    """Tabla para str.translate: alfanumérico → minúscula, resto → '-' (se completa al vuelo)."""
+
+    def __missing__(self, codepoint: int) -> str:
+        ch = chr(codepoint)
+        value = self[codepoint] = ch.lower() if ch.isalnum() else "-"
+        return value
+
+_SLUG_TABLE = _SlugTable()
 
 def _slug(s: str) -> str:
     """kebab-case minimalista (sin espacios/acentos) para nombres de archivo."""
-    return "".join(ch.lower() if ch.isalnum() else "-" for ch in s).strip("-")
+    return s.translate(_SLUG_TABLE).strip("-")
 
 def save_model_mps(model, base_dir: Path, scenario_name: str, run_id: str | None = None) -> Path:
     """
@@ -21,7 +32,7 @@ def save_model_mps(model, base_dir: Path, scenario_name: str, run_id: str | None
     Returns:
         Path al archivo .mps generado.
     """
-    ts = datetime.now().strftime("%Y%m%d-%H%M")
+    ts = time.strftime("%Y%m%d-%H%M")
     scen = _slug(scenario_name) or "scenario"
     rid = f"-{_slug(run_id)}" if run_id else ""
     out_dir = (Path(base_dir) / "models")
@@ -33,7 +44,7 @@ def save_model_mps(model, base_dir: Path, scenario_name: str, run_id: str | None
     # Etiquetas simbólicas y determinismo para reproducibilidad
     io_opts = {
         "symbolic_solver_labels": True,   # usa nombres de variables/cts
-        "file_determinism": 2,            # orden estable (Pyomo)
+        "file_determinism": FileDeterminism.SORT_SYMBOLS,  # orden estable (Pyomo)
     }
 
     # Escribe en MPS (lineal). Si alguna restricción no es lineal, considerar .lp
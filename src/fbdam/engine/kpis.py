@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional
 
-import pyomo.environ as pyo
+import numpy as np
 
-from fbdam.engine.domain import DomainIndex
+if TYPE_CHECKING:  # pragma: no cover - type checkers only
+    import pyomo.environ as pyo
+
+    from fbdam.engine.domain import DomainIndex
 
 
 def compute_kpis(
@@ -48,108 +51,179 @@ def compute_kpis(
         basic["feasibility_status"] = "INFEASIBLE"
         return {"kpi": {"basic": basic}}
 
+    # Values are rounded as they are stored (no second pass over the
+    # metrics); derived gaps below use the unrounded inputs
+    for key, value in basic.items():
+        basic[key] = _round5(value)
+
+    # Supply KPIs from the x/y values and stock/cost Params rather than by
+    # walking the reporting Expressions (TotAllocated, Undistributed, ...)
+    purchases = _var_vector(model.y, model.I)
+    avail = _param_vector(model.S, model.I) + purchases
+    total_avail = avail.sum()
+    allocation = _var_matrix(model.x, model.I, model.H)
+    total_allocation = _defined(allocation.sum())
+    n_households = allocation.shape[1]
+    if not n_households:
+        mean_allocation: Optional[float] = 0.0
+    elif total_allocation is None:
+        mean_allocation = None
+    else:
+        mean_allocation = total_allocation / n_households
+
     metrics["supply"] = {
-        "total_allocation": _safe_value(model.TotAllocated),
-        "avg_allocation_per_pair": _safe_value(model.MeanAllocated),
-        "undistributed": _safe_value(model.Undistributed),
-        "total_cost": _safe_value(model.TotalCost),
+        "total_allocation": _round5(total_allocation),
+        "avg_allocation_per_pair": _round5(mean_allocation),
+        "undistributed": _round5(_defined(total_avail - allocation.sum())),
+        "total_cost": _round5(_defined(_param_vector(model.cost, model.I) @ purchases)),
     }
 
-    total_utility = _safe_value(model.total_nutritional_utility)
-    global_mean = _safe_value(model.global_mean_utility)
-    min_household_mean = _safe_min(
-        _safe_value(model.household_mean_utility[h]) for h in model.H
-    )
-    min_nutrient_mean = _safe_min(
-        _safe_value(model.nutrient_mean_utility[n]) for n in model.N
-    )
-    min_pairwise_utility = _safe_min(
-        _safe_value(model.u[n, h]) for n in model.N for h in model.H
-    )
+    # Utility matrix U[n, h] pulled from the solution once; the sum/mean/min
+    # sweeps below are NumPy reductions over it (NaN marks unset values and
+    # propagates like an undefined Pyomo expression would)
+    utility = _var_matrix(model.u, model.N, model.H)
+    total_utility = _defined(utility.sum())
+    if not utility.size:
+        global_mean: Optional[float] = 0.0
+    elif total_utility is None:
+        global_mean = None
+    else:
+        global_mean = total_utility / utility.size
+    min_household_mean = _array_min(_axis_means(utility, axis=0))
+    min_nutrient_mean = _array_min(_axis_means(utility, axis=1))
+    min_pairwise_utility = _array_min(utility)
 
     metrics["nutrition"] = {
-        "total_nutritional_utility": total_utility,
-        "global_mean_utility": global_mean,
-        "min_household_mean_utility": min_household_mean,
-        "min_nutrient_mean_utility": min_nutrient_mean,
-        "min_pairwise_utility": min_pairwise_utility,
+        "total_nutritional_utility": _round5(total_utility),
+        "global_mean_utility": _round5(global_mean),
+        "min_household_mean_utility": _round5(min_household_mean),
+        "min_nutrient_mean_utility": _round5(min_nutrient_mean),
+        "min_pairwise_utility": _round5(min_pairwise_utility),
     }
 
+    # Deviation matrix D[i, h] = dpos + dneg, read once and shared by the
+    # per-item, per-household and pairwise sweeps
+    deviation = _var_matrix(model.dpos, model.I, model.H) + _var_matrix(
+        model.dneg, model.I, model.H
+    )
+
+    # Relative deviations broadcast D against the fair-share targets
+    # w[h] * Avail[i]; a zero target leaves the ratio undefined (NaN), as
+    # the division inside the model Expressions would
+    weights = _param_vector(model.fairshare_weight, model.H)
+    item_relative = _ratio(deviation.sum(axis=1), total_avail)
+    household_relative = _ratio(deviation.sum(axis=0), weights * total_avail)
+    pair_relative = _ratio(deviation, np.outer(avail, weights))
+
     metrics["allocation_equity"] = {
-        "global_mean_deviation_from_fairshare": _safe_value(model.global_mean_deviation_from_fairshare),
-        "max_household_mean_deviation": _safe_max(
-            _safe_value(model.household_mean_deviation_from_fairshare[h]) for h in model.H
-        ),
-        "max_item_mean_deviation": _safe_max(
-            _safe_value(model.item_mean_deviation_from_fairshare[i]) for i in model.I
-        ),
-        "max_pairwise_deviation": _safe_max(
-            _safe_value(model.dpos[i, h] + model.dneg[i, h]) for i in model.I for h in model.H
+        "global_mean_deviation_from_fairshare": _round5(
+            _defined(deviation.mean()) if deviation.size else 0.0
         ),
-        "max_household_relative_deviation": _safe_max(
-            _safe_value(model.household_mean_relative_deviation_from_fair_share[h]) for h in model.H
+        "max_household_mean_deviation": _round5(
+            _array_max(_axis_means(deviation, axis=0))
         ),
-        "max_item_relative_deviation": _safe_max(
-            _safe_value(model.item_mean_relative_deviation_from_fair_share[i]) for i in model.I
-        ),
-        "max_pairwise_relative_deviation": _safe_max(
-            _safe_value(model.pair_relative_deviation_from_fair_share[i, h]) for i in model.I for h in model.H
+        "max_item_mean_deviation": _round5(
+            _array_max(_axis_means(deviation, axis=1))
         ),
+        "max_pairwise_deviation": _round5(_array_max(deviation)),
+        "max_household_relative_deviation": _round5(_array_max(household_relative)),
+        "max_item_relative_deviation": _round5(_array_max(item_relative)),
+        "max_pairwise_relative_deviation": _round5(_array_max(pair_relative)),
     }
 
-    metrics["nutritional_adequacy"] = {
-        "min_household_mean_utility": min_household_mean,
-        "min_nutrient_mean_utility": min_nutrient_mean,
-        "min_pairwise_utility": min_pairwise_utility,
+    adequacy = metrics["nutritional_adequacy"] = {
+        "min_household_mean_utility": _round5(min_household_mean),
+        "min_nutrient_mean_utility": _round5(min_nutrient_mean),
+        "min_pairwise_utility": _round5(min_pairwise_utility),
     }
 
     if global_mean is not None and global_mean > 0:
-        adequacy = metrics["nutritional_adequacy"]
         min_vals = {
-            "household_adequacy_gap": adequacy["min_household_mean_utility"],
-            "nutrient_adequacy_gap": adequacy["min_nutrient_mean_utility"],
-            "pairwise_adequacy_gap": adequacy["min_pairwise_utility"],
+            "household_adequacy_gap": min_household_mean,
+            "nutrient_adequacy_gap": min_nutrient_mean,
+            "pairwise_adequacy_gap": min_pairwise_utility,
         }
         for key, value in min_vals.items():
             adequacy[key] = (
-                (global_mean - value) / global_mean if value is not None else None
+                _round5((global_mean - value) / global_mean) if value is not None else None
             )
 
-    for category in metrics.values():
-        for key, value in list(category.items()):
-            if isinstance(value, (int, float)):
-                category[key] = round(float(value), 5)
-
     return {"kpi": metrics}
 
 
-def _safe_value(expr: Any) -> Optional[float]:
-    """Evaluate a Pyomo expression returning ``None`` when undefined."""
+def _round5(value: Any) -> Any:
+    """Round numeric KPI values to 5 decimals (as floats); pass anything else through."""
+
+    if type(value) is float:  # the common case; skips the isinstance MRO walk
+        return round(value, 5)
+    if isinstance(value, (int, float)):
+        return round(float(value), 5)
+    return value
+
+
+def _var_matrix(var: Any, rows: Iterable[Any], cols: Iterable[Any]) -> np.ndarray:
+    """Dense ``(rows x cols)`` float64 matrix of a two-index Var (NaN where unset)."""
+
+    row_pos = {key: pos for pos, key in enumerate(rows)}
+    col_pos = {key: pos for pos, key in enumerate(cols)}
+    size = len(var)
+    flat = np.fromiter(
+        (row_pos[r] * len(col_pos) + col_pos[c] for r, c in var.keys()),
+        dtype=np.intp,
+        count=size,
+    )
+    out = np.full((len(row_pos), len(col_pos)), np.nan)
+    # np.array maps None (unset Var) to NaN under a float dtype
+    out.flat[flat] = np.array([data.value for data in var.values()], dtype=np.float64)
+    return out
+
+
+def _var_vector(var: Any, keys: Iterable[Any]) -> np.ndarray:
+    """float64 vector of a one-index Var in ``keys`` order (NaN where unset)."""
+
+    return np.array([var[key].value for key in keys], dtype=np.float64)
+
+
+def _param_vector(param: Any, keys: Iterable[Any]) -> np.ndarray:
+    """float64 vector of a one-index immutable Param in ``keys`` order."""
+
+    values = param.extract_values()
+    return np.array([values[key] for key in keys], dtype=np.float64)
+
+
+def _ratio(numerator: np.ndarray, denominator: Any) -> np.ndarray:
+    """Element-wise ``numerator / denominator`` with NaN wherever the denominator is zero."""
+
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+    out = np.full(numerator.shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def _axis_means(matrix: np.ndarray, axis: int) -> np.ndarray:
+    """Mean along ``axis``; an empty axis yields zeros, matching the model's 0.0 initialisation."""
+
+    if matrix.shape[axis] == 0:
+        return np.zeros(matrix.shape[1 - axis])
+    return matrix.mean(axis=axis)
+
+
+def _defined(value: float) -> Optional[float]:
+    """NumPy scalar to ``float``, with NaN (an unset input) mapped to ``None``."""
+
+    return None if np.isnan(value) else float(value)
+
 
-    try:
-        val = pyo.value(expr, exception=False)
-    except Exception:  # pragma: no cover - defensive guard
-        return None
-    if val is None:
-        return None
-    try:
-        return float(val)
-    except (TypeError, ValueError):  # pragma: no cover - defensive guard
-        return None
+def _array_min(values: np.ndarray) -> Optional[float]:
+    """Minimum over the non-NaN entries, ``None`` if there are none."""
 
+    defined = values[~np.isnan(values)]
+    return float(defined.min()) if defined.size else None
 
-def _safe_min(values: Iterable[Optional[float]]) -> Optional[float]:
-    """Return the minimum of non-null values from an iterable."""
 
-    filtered = [val for val in values if val is not None]
-    if not filtered:
-        return None
-    return min(filtered)
+def _array_max(values: np.ndarray) -> Optional[float]:
+    """Maximum over the non-NaN entries, ``None`` if there are none."""
 
-def _safe_max(values: Iterable[Optional[float]]) -> Optional[float]:
-    """Return the maximum of non-null values from an iterable."""
+    defined = values[~np.isnan(values)]
+    return float(defined.max()) if defined.size else None
 
-    filtered = [val for val in values if val is not None]
-    if not filtered:
-        return None
-    return max(filtered)
\ No newline at end of file
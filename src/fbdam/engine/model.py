@@ -25,17 +25,16 @@ This builder does NOT read files. All I/O/validation should happen in io.py.
 
 from __future__ import annotations
 
+from math import inf
 from typing import Any, Dict, Iterable, Mapping, Sequence, Tuple
+import numpy as np
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 from fbdam.engine.domain import (
     DomainIndex,
     Item,
-    Nutrient,
     Household,
-    Requirement,
-    ItemNutrient,
-    AllocationBounds,
 )
 from fbdam.engine.constraints import get_constraint
 from fbdam.engine.objectives import get_objective
@@ -200,59 +199,60 @@ def _build_sets(m: pyo.ConcreteModel, domain: DomainIndex) -> None:
 
 
 def _build_params(m: pyo.ConcreteModel, domain: DomainIndex) -> None:
-    """Create parameters: stock S[i], nutrient content a[i,n], requirements R[h,n], fairshare weights."""
+    """Create parameters: stock S[i], nutrient content a[i,n], requirements R[h,n], fairshare weights.
+
+    Values are precomputed into plain dicts and handed to Pyomo as
+    ``initialize`` data, so no Python rule callback runs per index.
+    """
 
     items: Mapping[str, Item] = domain.items
-    nutrients: Mapping[str, Nutrient] = domain.nutrients
     households: Mapping[str, Household] = domain.households
-    item_nutrients: Mapping[tuple, ItemNutrient] = domain.item_nutrients
-    requirements: Mapping[tuple, Requirement] = domain.requirements
+    item_ids, nutrient_ids, household_ids = domain.item_ids, domain.nutrient_ids, domain.household_ids
 
     # Stock per item (>= 0)
-    def _S_init(model, i):
-        return float(items[i].stock)
-    m.S = pyo.Param(m.I, initialize=_S_init, within=pyo.NonNegativeReals, doc="Stock per item")
+    m.S = pyo.Param(
+        m.I,
+        initialize={i: float(item.stock) for i, item in items.items()},
+        within=pyo.NonNegativeReals,
+        doc="Stock per item",
+    )
 
     # Optional purchase cost per item (>= 0)
-    def _cost_init(model, i):
-        return float(items[i].cost)
-
     m.cost = pyo.Param(
         m.I,
-        initialize=_cost_init,
+        initialize={i: float(item.cost) for i, item in items.items()},
         within=pyo.NonNegativeReals,
         doc="Purchase cost per additional unit of item",
     )
 
     # Household fair-share weight w[h] (>= 0)
-    def _fairshare_weight_init(model, h):
-        return float(households[h].fairshare_weight)
-
     m.fairshare_weight = pyo.Param(
         m.H,
-        initialize=_fairshare_weight_init,
+        initialize={h: float(household.fairshare_weight) for h, household in households.items()},
         within=pyo.NonNegativeReals,
         doc="Household fair-share weight",
     )
 
     # Nutrient content a[i,n] (>= 0), default 0 if (i,n) pair not present
-    def _a_init(model, i, n):
-        nutrient_entry = item_nutrients.get((i, n))
-        if nutrient_entry is None:
-            return 0.0
-        return float(nutrient_entry.qty_per_unit)
-    m.a = pyo.Param(m.I, m.N, initialize=_a_init, within=pyo.NonNegativeReals, doc="Nutrient content per item-unit")
+    a_rows = domain.item_nutrient_matrix.tolist()
+    a_values = {
+        (i, n): qty
+        for i, row in zip(item_ids, a_rows)
+        for n, qty in zip(nutrient_ids, row)
+    }
+    m.a = pyo.Param(m.I, m.N, initialize=a_values, within=pyo.NonNegativeReals, doc="Nutrient content per item-unit")
 
     # Requirements R[h,n] (>= 0), protect against division by zero with epsilon floor
     EPS_R = 1e-9
-
-    def _R_init(model, h, n):
-        req_entry = requirements.get((h, n))
-        amt = float(req_entry.amount) if req_entry is not None else 0.0
-        return max(amt, EPS_R)
+    R_rows = np.maximum(domain.requirement_matrix, EPS_R).tolist()
+    R_values = {
+        (h, n): amt
+        for h, row in zip(household_ids, R_rows)
+        for n, amt in zip(nutrient_ids, row)
+    }
 
     m.R = pyo.Param(
-        m.H, m.N, initialize=_R_init, within=pyo.NonNegativeReals, doc="Requirement amount (floored at eps)"
+        m.H, m.N, initialize=R_values, within=pyo.NonNegativeReals, doc="Requirement amount (floored at eps)"
     )
 
 
@@ -265,22 +265,22 @@ def _build_variables(
 ) -> None:
     """Create decision variables and common auxiliaries."""
 
-    bounds: Mapping[tuple, AllocationBounds] = domain.bounds
-
-    # Item-household allocation x[i,h] with per-(i,h) bounds if provided
-    def _x_bounds(model, i, h):
-        b = bounds.get((i, h))
-        if b is None:
-            return (0.0, None)
-        lb = float(b.lower)
-        ub = None if b.upper is None else float(b.upper)
-        return (lb, ub)
+    # Item-household allocation x[i,h] with per-(i,h) bounds if provided.
+    # Bounds come from the domain's dense matrices as one (lb, ub) dict so
+    # Var construction does no Python callback per index
+    lower_rows = domain.bounds_lower.tolist()
+    upper_rows = domain.bounds_upper.tolist()
+    x_bounds = {
+        (i, h): (lb, None if ub == inf else ub)
+        for i, lower_row, upper_row in zip(domain.item_ids, lower_rows, upper_rows)
+        for h, lb, ub in zip(domain.household_ids, lower_row, upper_row)
+    }
 
     m.x = pyo.Var(
         m.I,
         m.H,
         domain=x_domain,
-        bounds=_x_bounds,
+        bounds=x_bounds,
         doc="Allocation of item i to household h",
     )
 
@@ -310,13 +310,31 @@ def _build_variables(
 def _build_expressions(m: pyo.ConcreteModel) -> None:
     """Create common expressions used by multiple plugins (q, means, etc.)."""
 
+    # Plain tuples of the index sets, iterated by the rules below instead
+    # of going through the Pyomo Set API on every rule call
+    items, nutrients, households = tuple(m.I), tuple(m.N), tuple(m.H)
+
     # ------------------------------------------------------------
     # Basic expressions
     # ------------------------------------------------------------
 
     # Delivered nutrient quantity q[n,h] := sum_i a[i,n] * x[i,h]
+    # a[i,n] is constant, so each q is instantiated as a LinearExpression
+    # from coefficient/variable lists (no per-term operator overloading).
+    # Only items that actually carry nutrient n contribute a term.
+    a_values = m.a.extract_values()
+    q_support: Dict[Any, Tuple[list, list]] = {}
+    for n in nutrients:
+        support = [i for i in items if a_values[i, n] != 0.0]
+        q_support[n] = (support, [a_values[i, n] for i in support])
+
     def _q_expr(model, n, h):
-        return sum(model.a[i, n] * model.x[i, h] for i in model.I)
+        support, coefs = q_support[n]
+        return LinearExpression(
+            constant=0.0,
+            linear_coefs=coefs,
+            linear_vars=[model.x[i, h] for i in support],
+        )
     m.q = pyo.Expression(m.N, m.H, rule=_q_expr)
 
     # Available supply per item: Avail_i := S_i + y_i
@@ -326,12 +344,12 @@ def _build_expressions(m: pyo.ConcreteModel) -> None:
 
     # Total available supply: TotSupply := sum_i (S_i + y_i)
     def _total_supply_expr(model):
-        return sum(model.Avail[i] for i in model.I)
+        return pyo.quicksum(model.Avail[i] for i in items)
     m.TotSupply = pyo.Expression(rule=_total_supply_expr, doc="Total available supply across all items")
 
     # Total allocation per household: X_h := sum_i x[i,h]
     def _household_total_expr(model, h):
-        return sum(model.x[i, h] for i in model.I)
+        return pyo.quicksum(model.x[i, h] for i in items)
     m.X = pyo.Expression(m.H, rule=_household_total_expr, doc="Total allocation delivered to household h")
 
     # ------------------------------------------------------------
@@ -340,13 +358,13 @@ def _build_expressions(m: pyo.ConcreteModel) -> None:
 
     # Total allocated quantity: TotAllocated := sum_{i,h} x[i,h]
     def _total_allocated_expr(model):
-        return sum(model.x[i, h] for i in model.I for h in model.H)
+        return pyo.quicksum(model.x[i, h] for i in items for h in households)
     m.TotAllocated = pyo.Expression(rule=_total_allocated_expr, doc="Total allocated quantity across all items and households")
 
 
     # Mean allocated quantity per household: MeanAllocated := (1 / cardH) * TotAllocated
     def _mean_allocated_expr(model):
-        if len(model.H) == 0:
+        if len(households) == 0:
             return 0.0
         return model.TotAllocated / model.cardH
     m.MeanAllocated = pyo.Expression(rule=_mean_allocated_expr, doc="Mean allocated quantity per household")
@@ -360,7 +378,7 @@ def _build_expressions(m: pyo.ConcreteModel) -> None:
 
     # Total purchased cost: Cost := sum_i cost[i] * y[i]
     def _total_cost_expr(model):
-        return sum(model.cost[i] * model.y[i] for i in model.I)
+        return pyo.quicksum(model.cost[i] * model.y[i] for i in items)
     m.TotalCost = pyo.Expression(rule=_total_cost_expr, doc="Total purchase cost across all items")
 
 
@@ -374,14 +392,25 @@ def _build_expressions(m: pyo.ConcreteModel) -> None:
 
     # NUTRITIONAL ADEQUACY: total nutritional utility (Σ u[n,h])
     def _total_utility_expr(model):
-        return sum(model.u[n, h] for n in model.N for h in model.H)
+        return pyo.quicksum(model.u[n, h] for n in nutrients for h in households)
     m.total_nutritional_utility = pyo.Expression(rule=_total_utility_expr, doc="Aggregate nutritional utility")
 
 
+    # The per-household and per-nutrient views of u are gathered in one
+    # pass; both mean families below are scaled LinearExpressions over them
+    u_by_household: Dict[Any, list] = {h: [] for h in households}
+    u_by_nutrient: Dict[Any, list] = {n: [] for n in nutrients}
+    for (n, h), u_nh in m.u.items():
+        u_by_household[h].append(u_nh)
+        u_by_nutrient[n].append(u_nh)
+
     # NUTRITIONAL ADEQUACY: household mean utility (ȳ_h)
     def _mean_u_household(model, h):
-        return (1.0 / model.cardN) * sum(model.u[n, h] for n in model.N)
-    if len(m.N) == 0:
+        terms = u_by_household[h]
+        return LinearExpression(
+            constant=0.0, linear_coefs=[1.0 / len(nutrients)] * len(terms), linear_vars=terms
+        )
+    if len(nutrients) == 0:
         m.household_mean_utility = pyo.Expression(m.H, initialize=0.0)
     else:
         m.household_mean_utility = pyo.Expression(m.H, rule=_mean_u_household)
@@ -389,8 +418,11 @@ def _build_expressions(m: pyo.ConcreteModel) -> None:
 
     # NUTRITIONAL ADEQUACY: nutrient mean utility (ȳ_n)
     def _mean_u_nutrient(model, n):
-        return (1.0 / model.cardH) * sum(model.u[n, h] for h in model.H)
-    if len(m.H) == 0:
+        terms = u_by_nutrient[n]
+        return LinearExpression(
+            constant=0.0, linear_coefs=[1.0 / len(households)] * len(terms), linear_vars=terms
+        )
+    if len(households) == 0:
         m.nutrient_mean_utility = pyo.Expression(m.N, initialize=0.0)
     else:
         m.nutrient_mean_utility = pyo.Expression(m.N, rule=_mean_u_nutrient)
@@ -398,9 +430,9 @@ def _build_expressions(m: pyo.ConcreteModel) -> None:
 
     # NUTRITIONAL ADEQUACY: global mean utility baseline (ū_global)
     def _global_mean(model):
-        if len(model.N) == 0 or len(model.H) == 0:
+        if len(nutrients) == 0 or len(households) == 0:
             return 0.0
-        return model.total_nutritional_utility / (model.cardN * model.cardH)
+        return (1.0 / (len(nutrients) * len(households))) * model.total_nutritional_utility
     m.global_mean_utility = pyo.Expression(
         rule=_global_mean, doc="Global mean utility across all nutrient-household pairs"
     )
@@ -415,7 +447,7 @@ def _build_expressions(m: pyo.ConcreteModel) -> None:
 
     # ALLOCATION EQUITY: total deviation from fair-share (Σ δ)
     def _total_deviation_expr(model):
-        return sum(model.dpos[i, h] + model.dneg[i, h] for i in model.I for h in model.H)
+        return pyo.quicksum(model.dpos[i, h] + model.dneg[i, h] for i in items for h in households)
     m.total_deviation_from_fairshare = pyo.Expression(rule=_total_deviation_expr)
 
     # ----------------------------
@@ -424,21 +456,21 @@ def _build_expressions(m: pyo.ConcreteModel) -> None:
 
     # ALLOCATION EQUITY: item mean absolute deviation (materialised α)
     def _mean_deviation_item(model, i):
-        return (1.0 / model.cardH) * sum(model.dpos[i, h] + model.dneg[i, h] for h in model.H)
+        return (1.0 / model.cardH) * pyo.quicksum(model.dpos[i, h] + model.dneg[i, h] for h in households)
     m.item_mean_deviation_from_fairshare = pyo.Expression(m.I, rule=_mean_deviation_item)
 
 
     # ALLOCATION EQUITY: household mean absolute deviation (materialised β)
     def _mean_deviation_household(model, h):
-        return (1.0 / model.cardI) * sum(model.dpos[i, h] + model.dneg[i, h] for i in model.I)
+        return (1.0 / model.cardI) * pyo.quicksum(model.dpos[i, h] + model.dneg[i, h] for i in items)
     m.household_mean_deviation_from_fairshare = pyo.Expression(m.H, rule=_mean_deviation_household)
 
 
     # ALLOCATION EQUITY: global mean absolute deviation from fair-share
     def _global_mean_deviation(model):
-        if len(model.I) == 0 or len(model.H) == 0:
+        if len(items) == 0 or len(households) == 0:
             return 0.0
-        return model.total_deviation_from_fairshare / (model.cardI * model.cardH)
+        return (1.0 / (len(items) * len(households))) * model.total_deviation_from_fairshare
     m.global_mean_deviation_from_fairshare = pyo.Expression(rule=_global_mean_deviation)
 
     # ----------------------------
@@ -447,15 +479,14 @@ def _build_expressions(m: pyo.ConcreteModel) -> None:
 
     # ALLOCATION EQUITY: item mean relative deviation (materialised α)
     def _relative_deviation_from_fair_share_item(model, i):
-        total_item_deviation = sum(model.dpos[i, h] + model.dneg[i, h] for h in model.H) # sum over households for item i
-        total_available = sum(model.Avail[i] for i in model.I)
-        return total_item_deviation / total_available
+        total_item_deviation = pyo.quicksum(model.dpos[i, h] + model.dneg[i, h] for h in households) # sum over households for item i
+        return total_item_deviation / model.TotSupply
     m.item_mean_relative_deviation_from_fair_share = pyo.Expression(m.I, rule=_relative_deviation_from_fair_share_item)
 
     # ALLOCATION EQUITY: household mean relative deviation (materialised β)
     def _relative_deviation_from_fair_share_household(model, h):
-        total_household_deviation = sum(model.dpos[i, h] + model.dneg[i, h] for i in model.I) # sum over items for household h
-        fair_target = sum(model.fairshare_weight[h] * model.Avail[i] for i in model.I)
+        total_household_deviation = pyo.quicksum(model.dpos[i, h] + model.dneg[i, h] for i in items) # sum over items for household h
+        fair_target = model.fairshare_weight[h] * model.TotSupply
         return total_household_deviation / fair_target
     m.household_mean_relative_deviation_from_fair_share = pyo.Expression(m.H, rule=_relative_deviation_from_fair_share_household)
 
@@ -489,12 +520,16 @@ def _apply_constraint_plugins(m: pyo.ConcreteModel, constraint_specs: Iterable[d
     Each spec should contain:
       { "id": "<registry name>", "params": {...} }
     """
+    # Resolve every handler up front, then apply them in one tight loop
+    resolved = []
     for idx, c in enumerate(constraint_specs, start=1):
         name = _get_constraint_name(c)
         params: Dict = c.get("params", {})
         if not name:
             raise ValueError(f"Constraint spec at position {idx} missing 'id' key.")
-        handler = get_constraint(name)
+        resolved.append((get_constraint(name), params))
+
+    for handler, params in resolved:
         handler(m, params)
 
 
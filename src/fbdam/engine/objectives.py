@@ -76,10 +76,10 @@ def _sense_to_pyomo(sense: Optional[str]) -> object:
 
 def _get_lambda_value(model_params: Mapping[str, object] | None) -> float | None:
     params = model_params or {}
-    for key in ("lambda", "lambda_", "lam"):
-        if key in params:
-            return float(params[key])
-    return None
+    value = params.get("lambda")
+    if value is None:
+        value = params.get("lambda_", params.get("lam"))
+    return None if value is None else float(value)
 
 
 # ---------------------------------------------------------------------
@@ -409,11 +409,14 @@ def extract_model_stats(model: pyo.ConcreteModel) -> Dict[str, Any]:
 
     for var in model.component_objects(pyo.Var, active=True):
         name = var.getname()
-        for idx in var:
-            vars_by_domain[name] = vars_by_domain.get(name, 0) + 1
-            total_vars += 1
-
-            vardata = var[idx]
+        count = len(var)
+        if not count:
+            continue
+        vars_by_domain[name] = vars_by_domain.get(name, 0) + count
+        total_vars += count
+
+        # One pass over the data objects (no per-index re-lookup)
+        for vardata in var.values():
             if getattr(vardata, "is_binary", None) and vardata.is_binary():
                 vars_by_type["Binary"] += 1
             elif getattr(vardata, "is_integer", None) and vardata.is_integer():
@@ -425,7 +428,7 @@ def extract_model_stats(model: pyo.ConcreteModel) -> Dict[str, Any]:
     total_cons = 0
     for cons in model.component_objects(pyo.Constraint, active=True):
         name = cons.getname()
-        count = sum(1 for _ in cons.index_set()) if cons.is_indexed() else 1
+        count = len(cons.index_set()) if cons.is_indexed() else 1
         cons_by_block[name] = cons_by_block.get(name, 0) + count
         total_cons += count
 
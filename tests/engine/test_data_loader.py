@@ -1,6 +1,9 @@
 """Unit tests for the CSV data loader utilities."""
 
+import copy
+import pickle
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -47,3 +50,195 @@ def test_dataset_a_balanced_is_loaded_correctly():
     assert params["dials"]["alpha_i"] == pytest.approx(0.3)
     assert params["dials"]["beta_h"] == pytest.approx(0.3)
     assert len(params["dials"]) == 6
+
+
+def test_loaded_scenario_survives_pickle_and_deepcopy():
+    cfg = load_scenario(ROOT / "scenarios" / "ds-a_dials-balanced.yaml")
+    cfg.domain.item_nutrient_matrix  # cached views must not break the round trip
+
+    for clone in (pickle.loads(pickle.dumps(cfg)), copy.deepcopy(cfg)):
+        domain = clone.domain
+        assert domain == cfg.domain
+        assert isinstance(domain.items, MappingProxyType)
+        assert dict(domain.bounds) == dict(cfg.domain.bounds)
+        assert (domain.item_nutrient_matrix == cfg.domain.item_nutrient_matrix).all()
+        assert clone.model_params == cfg.model_params
+
+
+def test_stdlib_fallback_matches_pyarrow_reader(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    from fbdam.engine import data_loader
+
+    scenario_path = ROOT / "scenarios" / "ds-a_dials-balanced.yaml"
+    fast = load_scenario(scenario_path).domain
+
+    # Ragged rows are padded/truncated, blank numeric cells stay "" and bad
+    # cells are reported as file:line by both backends
+    ragged = tmp_path / "ragged.csv"
+    ragged.write_text(
+        "item_id,name,stock,cost,unit\nrice,Rice,3,1\nbeans,Beans,,2,kg,extra\n",
+        encoding="utf-8",
+    )
+    bad_cell = tmp_path / "items.csv"
+    bad_cell.write_text("item_id,name,stock\nrice,Rice,3\nbeans,Beans,abc\n", encoding="utf-8")
+
+    def read_ragged():
+        return data_loader._read_columns(
+            ragged, required_columns={"item_id"}, numeric_columns={"stock", "cost"}
+        )
+
+    fast_ragged = read_ragged()
+    with pytest.raises(data_loader.DataLoaderError, match=r"items.csv:3: Cannot convert 'stock'='abc'"):
+        data_loader._load_items(bad_cell)
+
+    monkeypatch.setattr(data_loader, "pa_csv", None)
+    fallback = load_scenario(scenario_path).domain
+
+    assert fast == fallback
+    assert fast_ragged == read_ragged()
+    assert fast_ragged["stock"] == [3.0, ""]
+    with pytest.raises(data_loader.DataLoaderError, match=r"items.csv:3: Cannot convert 'stock'='abc'"):
+        data_loader._load_items(bad_cell)
+
+
+@pytest.mark.parametrize("fast_csv", [True, False])
+def test_missing_columns_error_lists_sorted_names(tmp_path, monkeypatch, fast_csv):
+    from fbdam.engine import data_loader
+
+    if fast_csv:
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(data_loader, "pa_csv", None)
+    # A UTF-8 BOM glues itself to the first header name
+    items = tmp_path / "items.csv"
+    items.write_text("\ufeffitem_id,name,stock\nrice,Rice,3\n", encoding="utf-8")
+
+    with pytest.raises(data_loader.DataLoaderError) as excinfo:
+        data_loader._load_items(items)
+    assert str(excinfo.value) == (
+        "items.csv: Missing required columns: ['item_id']. "
+        "Found: ['name', 'stock', '\\ufeffitem_id']"
+    )
+
+def test_validate_references_reports_unknown_ids():
+    from fbdam.engine.data_loader import DataLoaderError, _validate_references
+
+    with pytest.raises(DataLoaderError, match=r"2 unknown item_id values: \['b', 'c'\]"):
+        _validate_references(
+            {"a": None},
+            {"n": None},
+            {"h": None},
+            {("a", "n"): None, ("b", "n"): None, ("c", "n"): None},
+            {},
+            {},
+        )
+
+
+def test_default_bounds_rows_are_not_stored(tmp_path):
+    from fbdam.engine.data_loader import _load_bounds
+    from fbdam.engine.domain import AllocationBounds
+
+    csv_path = tmp_path / "household_item_bounds.csv"
+    csv_path.write_text(
+        "household_id,item_id,lower,upper\nH1,rice,0,\nH1,beans,0,4\nH2,rice,1,\n",
+        encoding="utf-8",
+    )
+
+    bounds, default_keys = _load_bounds(csv_path)
+    assert set(bounds) == {("beans", "H1"), ("rice", "H2")}
+    assert bounds[("rice", "H2")] == AllocationBounds("rice", "H2", lower=1.0, upper=None)
+    assert default_keys == {("rice", "H1")}
+
+
+def test_later_default_bounds_row_overrides_earlier_row(tmp_path):
+    from fbdam.engine.data_loader import _load_bounds
+
+    csv_path = tmp_path / "household_item_bounds.csv"
+    csv_path.write_text(
+        "household_id,item_id,lower,upper\nH1,rice,1,\nH1,rice,0,\n",
+        encoding="utf-8",
+    )
+
+    bounds, _ = _load_bounds(csv_path)
+    assert ("rice", "H1") not in bounds
+
+
+def test_default_bounds_rows_are_still_reference_checked(tmp_path):
+    import shutil
+
+    from fbdam.engine.data_loader import DataLoaderError, load_domain_and_params
+
+    dataset = tmp_path / "ds-a"
+    shutil.copytree(ROOT / "data" / "ds-a", dataset)
+    with (dataset / "household_item_bounds.csv").open("a", encoding="utf-8") as fh:
+        fh.write("\nH1,ghost,0,\n")
+
+    data_paths = {
+        name: dataset / f"{name}.csv"
+        for name in ("items", "nutrients", "households", "item_nutrients", "requirements")
+    }
+    data_paths["bounds"] = dataset / "household_item_bounds.csv"
+    with pytest.raises(DataLoaderError, match="bounds references unknown item_id='ghost'"):
+        load_domain_and_params(data_paths, {})
+
+
+def test_bulk_validated_relations_match_checked_construction(tmp_path):
+    from fbdam.engine.data_loader import _load_item_nutrients
+    from fbdam.engine.domain import ItemNutrient
+
+    csv_path = tmp_path / "item_nutrients.csv"
+    csv_path.write_text("item_id,nutrient_id,qty_per_unit\nrice,cal,3.5\n", encoding="utf-8")
+    assert _load_item_nutrients(csv_path) == {("rice", "cal"): ItemNutrient("rice", "cal", 3.5)}
+
+    csv_path.write_text("item_id,nutrient_id,qty_per_unit\nrice,cal,-1\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="qty_per_unit must be >= 0"):
+        _load_item_nutrients(csv_path)
+
+
+def test_relation_arrays_mirror_relation_dicts():
+    domain = load_scenario(ROOT / "scenarios" / "ds-a_dials-balanced.yaml").domain
+    items = domain.item_ids
+    nutrients = domain.nutrient_ids
+    assert all(domain.item_positions[item_id] == pos for pos, item_id in enumerate(items))
+
+    arrays = domain.item_nutrient_arrays
+    assert len(arrays) == len(domain.item_nutrients)
+    for row, col, value in zip(arrays.rows, arrays.cols, arrays.values):
+        entry = domain.item_nutrients[(items[row], nutrients[col])]
+        assert value == pytest.approx(entry.qty_per_unit)
+    assert not arrays.values.flags.writeable
+
+
+def test_dense_bounds_fill_defaults_for_missing_pairs():
+    domain = load_scenario(ROOT / "scenarios" / "ds-a_dials-balanced.yaml").domain
+    for i, item_id in enumerate(domain.item_ids):
+        for h, household_id in enumerate(domain.household_ids):
+            bounds = domain.get_bounds(item_id, household_id)
+            assert domain.bounds_lower[i, h] == pytest.approx(bounds.lower)
+            upper = float("inf") if bounds.upper is None else bounds.upper
+            assert domain.bounds_upper[i, h] == pytest.approx(upper)
+
+
+def test_feather_cache_is_reused_and_invalidated(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    from fbdam.engine import data_loader
+
+    monkeypatch.setenv("FBDAM_CSV_CACHE", "1")
+    csv_path = tmp_path / "items.csv"
+    csv_path.write_text("item_id,name,stock\nrice,Rice,3\n", encoding="utf-8")
+
+    first = data_loader._load_items(csv_path)
+    caches = list(tmp_path.glob("items.csv.*.feather"))
+    assert len(caches) == 1
+    assert data_loader._load_items(csv_path) == first
+
+    # A truncated cache is discarded and rebuilt instead of failing the load
+    caches[0].write_bytes(caches[0].read_bytes()[:10])
+    assert data_loader._load_items(csv_path) == first
+    assert data_loader._load_items(csv_path) == first
+    assert not list(tmp_path.glob("*.tmp"))
+
+    csv_path.write_text("item_id,name,stock\nrice,Rice,3\nbeans,Beans,4\n", encoding="utf-8")
+    assert set(data_loader._load_items(csv_path)) == {"rice", "beans"}
+    assert list(tmp_path.glob("items.csv.*.feather")) != caches
+    assert len(list(tmp_path.glob("items.csv.*.feather"))) == 1
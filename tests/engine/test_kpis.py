@@ -0,0 +1,174 @@
+"""KPIs computed from Var/Param values must match the model's reporting Expressions."""
+
+from __future__ import annotations
+
+import pyomo.environ as pyo
+import pytest
+
+from fbdam.engine.domain import DomainIndex, Household, Item, ItemNutrient, Nutrient, Requirement
+from fbdam.engine.kpis import compute_kpis
+from fbdam.engine.model import build_model
+
+
+def _make_domain(*, with_nutrients: bool = True) -> DomainIndex:
+    items = {
+        "rice": Item(item_id="rice", name="Rice", stock=10.0, cost=2.5),
+        "beans": Item(item_id="beans", name="Beans", stock=5.0, cost=3.0),
+    }
+    nutrients = {
+        "protein": Nutrient(nutrient_id="protein", name="Protein"),
+        "calcium": Nutrient(nutrient_id="calcium", name="Calcium"),
+    }
+    households = {
+        "h1": Household(household_id="h1", name="H1", members=3, fairshare_weight=0.6),
+        "h2": Household(household_id="h2", name="H2", members=2, fairshare_weight=0.4),
+    }
+    item_nutrients = {
+        ("rice", "protein"): ItemNutrient(item_id="rice", nutrient_id="protein", qty_per_unit=2.0),
+        ("beans", "calcium"): ItemNutrient(item_id="beans", nutrient_id="calcium", qty_per_unit=4.0),
+    }
+    requirements = {
+        ("h1", "protein"): Requirement(household_id="h1", nutrient_id="protein", amount=5.0),
+        ("h2", "calcium"): Requirement(household_id="h2", nutrient_id="calcium", amount=3.0),
+    }
+    if not with_nutrients:
+        nutrients, item_nutrients, requirements = {}, {}, {}
+    return DomainIndex(
+        items=items,
+        nutrients=nutrients,
+        households=households,
+        item_nutrients=item_nutrients,
+        requirements=requirements,
+        bounds={},
+    )
+
+
+def _build(domain: DomainIndex) -> pyo.ConcreteModel:
+    return build_model(
+        {
+            "domain": domain,
+            "model_params": {"allow_purchases": True},
+            "model": {"constraints": [], "objectives": []},
+        }
+    )
+
+
+def _set_values(model: pyo.ConcreteModel, *, leave_unset: bool) -> None:
+    for k, var in enumerate(model.x.values()):
+        var.set_value(k + 1)
+    for k, var in enumerate(model.y.values()):
+        var.set_value(0.5 * k)
+    for k, var in enumerate(model.u.values()):
+        var.set_value(0.1 + 0.2 * k)
+    for k, var in enumerate(model.dpos.values()):
+        var.set_value(0.25 * k)
+    for k, var in enumerate(model.dneg.values()):
+        var.set_value(0.75 if k % 2 else 0.0)
+    if leave_unset:
+        next(iter(model.u.values())).set_value(None)
+        next(iter(model.dneg.values())).set_value(None)
+
+
+def _value(expr) -> float | None:
+    try:
+        value = pyo.value(expr, exception=False)
+    except ZeroDivisionError:
+        return None
+    return None if value is None else float(value)
+
+
+def _reduce(reducer, values):
+    defined = [v for v in values if v is not None]
+    return reducer(defined) if defined else None
+
+
+def _expected(model: pyo.ConcreteModel) -> dict:
+    def values(component):
+        return [_value(data) for data in component.values()]
+
+    pairwise = [
+        _value(model.dpos[i, h] + model.dneg[i, h]) for i in model.I for h in model.H
+    ]
+    return {
+        "supply": {
+            "total_allocation": _value(model.TotAllocated),
+            "avg_allocation_per_pair": _value(model.MeanAllocated),
+            "undistributed": _value(model.Undistributed),
+            "total_cost": _value(model.TotalCost),
+        },
+        "nutrition": {
+            "total_nutritional_utility": _value(model.total_nutritional_utility),
+            "global_mean_utility": _value(model.global_mean_utility),
+            "min_household_mean_utility": _reduce(min, values(model.household_mean_utility)),
+            "min_nutrient_mean_utility": _reduce(min, values(model.nutrient_mean_utility)),
+            "min_pairwise_utility": _reduce(min, values(model.u)),
+        },
+        "allocation_equity": {
+            "global_mean_deviation_from_fairshare": _value(
+                model.global_mean_deviation_from_fairshare
+            ),
+            "max_household_mean_deviation": _reduce(
+                max, values(model.household_mean_deviation_from_fairshare)
+            ),
+            "max_item_mean_deviation": _reduce(max, values(model.item_mean_deviation_from_fairshare)),
+            "max_pairwise_deviation": _reduce(max, pairwise),
+            "max_household_relative_deviation": _reduce(
+                max, values(model.household_mean_relative_deviation_from_fair_share)
+            ),
+            "max_item_relative_deviation": _reduce(
+                max, values(model.item_mean_relative_deviation_from_fair_share)
+            ),
+            "max_pairwise_relative_deviation": _reduce(
+                max, values(model.pair_relative_deviation_from_fair_share)
+            ),
+        },
+    }
+
+
+def _assert_matches(kpi: dict, expected: dict) -> None:
+    for section, entries in expected.items():
+        for key, value in entries.items():
+            got = kpi[section][key]
+            if value is None:
+                assert got is None, (section, key)
+            else:
+                assert got == pytest.approx(value, abs=1e-5), (section, key)
+
+
+@pytest.mark.parametrize("leave_unset", [False, True])
+def test_kpis_match_model_expressions(leave_unset: bool) -> None:
+    domain = _make_domain()
+    model = _build(domain)
+    _set_values(model, leave_unset=leave_unset)
+
+    kpi = compute_kpis(model, domain, {})["kpi"]
+
+    _assert_matches(kpi, _expected(model))
+    if leave_unset:
+        # An unset Var leaves totals undefined (None), never NaN
+        assert kpi["nutrition"]["total_nutritional_utility"] is None
+        assert kpi["nutrition"]["global_mean_utility"] is None
+        assert kpi["allocation_equity"]["global_mean_deviation_from_fairshare"] is None
+
+
+def test_kpis_on_unsolved_model_are_undefined() -> None:
+    domain = _make_domain()
+    model = _build(domain)
+
+    kpi = compute_kpis(model, domain, {})["kpi"]
+
+    _assert_matches(kpi, _expected(model))
+    assert kpi["nutrition"]["min_pairwise_utility"] is None
+
+
+def test_kpis_with_empty_nutrient_set() -> None:
+    domain = _make_domain(with_nutrients=False)
+    model = _build(domain)
+    _set_values(model, leave_unset=False)
+
+    kpi = compute_kpis(model, domain, {})["kpi"]
+
+    _assert_matches(kpi, _expected(model))
+    assert kpi["nutrition"]["global_mean_utility"] == 0.0
+    assert kpi["nutrition"]["min_household_mean_utility"] == 0.0
+    assert kpi["nutrition"]["min_nutrient_mean_utility"] is None